@@ -4,8 +4,9 @@ This module provides pre-defined example search configurations for common use ca
 and comprehensive documentation for Gmail search operators with helpful suggestions.
 """
 
+import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, TextIO, Tuple, Union
 from config.search_configs import SearchConfig
 
 
@@ -441,34 +442,85 @@ class GmailSearchHelp:
         Returns:
             List of suggestions for improving the query
         """
-        suggestions = []
         query_lower = query.lower()
         
-        # Suggest combining operators for better results
-        if 'from:' in query_lower and 'is:unread' not in query_lower:
-            suggestions.append("Consider adding 'is:unread' to focus on unread emails")
-        
-        if 'has:attachment' in query_lower and 'larger:' not in query_lower:
-            suggestions.append("Consider adding 'larger:1M' to find emails with substantial attachments")
-        
-        if 'subject:' in query_lower and not any(op in query_lower for op in ['from:', 'after:', 'before:']):
-            suggestions.append("Consider adding sender or date filters to narrow results")
-        
-        # Suggest date filters for better performance
-        if not any(date_op in query_lower for date_op in ['after:', 'before:', 'newer_than:', 'older_than:']):
-            suggestions.append("Consider adding date filters (after:, newer_than:) for better performance")
-        
-        # Suggest specific patterns based on query content
-        if 'meeting' in query_lower:
-            suggestions.append("Try: subject:(meeting OR call OR invite) for comprehensive meeting search")
-        
-        if 'urgent' in query_lower or 'important' in query_lower:
-            suggestions.append("Try: (subject:urgent OR is:important) for comprehensive urgent email search")
-        
-        if 'work' in query_lower or '@company' in query_lower:
-            suggestions.append("Consider combining with has:attachment for work documents")
-        
-        return suggestions
+        return [
+            suggestion
+            for required, excluded, suggestion in _SUGGESTION_RULES
+            if (not required or any(term in query_lower for term in required))
+            and not any(term in query_lower for term in excluded)
+        ]
+
+
+# Query improvement rules as (required, excluded, suggestion). A suggestion
+# applies when the lowercased query contains one of the required terms (if
+# any) and none of the excluded terms.
+_SUGGESTION_RULES = [
+    # Suggest combining operators for better results
+    (('from:',), ('is:unread',),
+     "Consider adding 'is:unread' to focus on unread emails"),
+    (('has:attachment',), ('larger:',),
+     "Consider adding 'larger:1M' to find emails with substantial attachments"),
+    (('subject:',), ('from:', 'after:', 'before:'),
+     "Consider adding sender or date filters to narrow results"),
+    
+    # Suggest date filters for better performance
+    ((), ('after:', 'before:', 'newer_than:', 'older_than:'),
+     "Consider adding date filters (after:, newer_than:) for better performance"),
+    
+    # Suggest specific patterns based on query content
+    (('meeting',), (),
+     "Try: subject:(meeting OR call OR invite) for comprehensive meeting search"),
+    (('urgent', 'important'), (),
+     "Try: (subject:urgent OR is:important) for comprehensive urgent email search"),
+    (('work', '@company'), (),
+     "Consider combining with has:attachment for work documents"),
+]
+
+
+# Operators documented by the help system, for constant-time membership checks
+OPERATOR_KEYS = frozenset(GmailSearchHelp.OPERATORS)
+
+
+# (name, query, description) of the example search configurations
+_EXAMPLE_CONFIGS = (
+    ("work-urgent",
+     "from:@company.com subject:urgent is:unread",
+     "Urgent unread emails from work domain"),
+    ("recent-attachments",
+     "has:attachment newer_than:7d",
+     "Emails with attachments from the last 7 days"),
+    ("large-files",
+     "larger:10M has:attachment",
+     "Emails with large attachments (>10MB) for storage cleanup"),
+    ("meeting-invites",
+     "subject:(meeting OR call OR invite OR calendar) is:unread",
+     "Unread meeting invitations and calendar events"),
+    ("today-important",
+     "is:important newer_than:1d",
+     "Important emails from today"),
+    ("weekly-digest",
+     "(subject:digest OR subject:summary OR subject:weekly) newer_than:7d",
+     "Weekly digests and summary emails"),
+    ("support-tickets",
+     "(from:support OR from:noreply OR subject:ticket) is:unread",
+     "Unread support tickets and automated notifications"),
+    ("personal-unread",
+     "is:unread -from:@company.com -subject:newsletter -subject:notification",
+     "Personal unread emails excluding work and newsletters"),
+    ("old-newsletters",
+     "(subject:newsletter OR subject:unsubscribe) older_than:30d is:read",
+     "Old read newsletters for cleanup and unsubscribing"),
+    ("project-alpha",
+     '(subject:"project alpha" OR subject:"alpha project") has:attachment',
+     "Project Alpha related emails with attachments"),
+    ("expense-reports",
+     "(subject:expense OR subject:receipt OR filename:pdf) from:@company.com",
+     "Expense reports and receipts from work"),
+    ("social-media",
+     "(from:@facebook.com OR from:@twitter.com OR from:@linkedin.com) newer_than:3d",
+     "Recent social media notifications"),
+)
 
 
 class ExampleConfigurations:
@@ -478,87 +530,17 @@ class ExampleConfigurations:
     def get_example_configs(cls) -> List[SearchConfig]:
         """Get a list of example search configurations.
         
+        Each call builds new SearchConfig instances stamped with the current
+        time, so callers may modify them freely.
+        
         Returns:
             List of SearchConfig instances with common use cases
         """
         now = datetime.now()
-        
-        examples = [
-            SearchConfig(
-                name="work-urgent",
-                query="from:@company.com subject:urgent is:unread",
-                description="Urgent unread emails from work domain",
-                created_at=now
-            ),
-            SearchConfig(
-                name="recent-attachments",
-                query="has:attachment newer_than:7d",
-                description="Emails with attachments from the last 7 days",
-                created_at=now
-            ),
-            SearchConfig(
-                name="large-files",
-                query="larger:10M has:attachment",
-                description="Emails with large attachments (>10MB) for storage cleanup",
-                created_at=now
-            ),
-            SearchConfig(
-                name="meeting-invites",
-                query="subject:(meeting OR call OR invite OR calendar) is:unread",
-                description="Unread meeting invitations and calendar events",
-                created_at=now
-            ),
-            SearchConfig(
-                name="today-important",
-                query="is:important newer_than:1d",
-                description="Important emails from today",
-                created_at=now
-            ),
-            SearchConfig(
-                name="weekly-digest",
-                query="(subject:digest OR subject:summary OR subject:weekly) newer_than:7d",
-                description="Weekly digests and summary emails",
-                created_at=now
-            ),
-            SearchConfig(
-                name="support-tickets",
-                query="(from:support OR from:noreply OR subject:ticket) is:unread",
-                description="Unread support tickets and automated notifications",
-                created_at=now
-            ),
-            SearchConfig(
-                name="personal-unread",
-                query="is:unread -from:@company.com -subject:newsletter -subject:notification",
-                description="Personal unread emails excluding work and newsletters",
-                created_at=now
-            ),
-            SearchConfig(
-                name="old-newsletters",
-                query="(subject:newsletter OR subject:unsubscribe) older_than:30d is:read",
-                description="Old read newsletters for cleanup and unsubscribing",
-                created_at=now
-            ),
-            SearchConfig(
-                name="project-alpha",
-                query='(subject:"project alpha" OR subject:"alpha project") has:attachment',
-                description="Project Alpha related emails with attachments",
-                created_at=now
-            ),
-            SearchConfig(
-                name="expense-reports",
-                query="(subject:expense OR subject:receipt OR filename:pdf) from:@company.com",
-                description="Expense reports and receipts from work",
-                created_at=now
-            ),
-            SearchConfig(
-                name="social-media",
-                query="(from:@facebook.com OR from:@twitter.com OR from:@linkedin.com) newer_than:3d",
-                description="Recent social media notifications",
-                created_at=now
-            )
+        return [
+            SearchConfig(name=name, query=query, description=description, created_at=now)
+            for name, query, description in _EXAMPLE_CONFIGS
         ]
-        
-        return examples
     
     @classmethod
     def get_config_by_category(cls) -> Dict[str, List[SearchConfig]]:
@@ -641,49 +623,62 @@ def validate_example_configurations() -> Tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
-def create_example_config_file(file_path: str = "example_search_configs.json") -> bool:
+def build_example_config_payload() -> Dict[str, Any]:
+    """Build the example configuration document written by create_example_config_file.
+    
+    Returns:
+        Dictionary with categorized and complete example configurations
+    """
+    examples = ExampleConfigurations.get_example_configs()
+    categories = ExampleConfigurations.get_config_by_category()
+    
+    example_data = {
+        "version": "1.0",
+        "description": "Example Gmail search configurations for common use cases",
+        "usage": "Use --save-config to add any of these examples to your personal configurations",
+        "categories": {},
+        "all_examples": {}
+    }
+    
+    # Add categorized examples
+    for category, configs in categories.items():
+        example_data["categories"][category] = {
+            config.name: {
+                "query": config.query,
+                "description": config.description,
+                "usage_example": f"--search-config {config.name}"
+            }
+            for config in configs
+        }
+    
+    # Add all examples
+    for config in examples:
+        example_data["all_examples"][config.name] = config.to_dict()
+    
+    return example_data
+
+
+def create_example_config_file(file_path: Union[str, TextIO] = "example_search_configs.json") -> bool:
     """Create a JSON file with example configurations for reference.
     
     Args:
-        file_path: Path where to create the example file
+        file_path: Path where to create the example file, or a writable
+            text file-like object
         
     Returns:
         True if file was created successfully
     """
     try:
-        import json
-        
-        examples = ExampleConfigurations.get_example_configs()
-        categories = ExampleConfigurations.get_config_by_category()
-        
-        example_data = {
-            "version": "1.0",
-            "description": "Example Gmail search configurations for common use cases",
-            "usage": "Use --save-config to add any of these examples to your personal configurations",
-            "categories": {},
-            "all_examples": {}
-        }
+        example_data = build_example_config_payload()
         
-        # Add categorized examples
-        for category, configs in categories.items():
-            example_data["categories"][category] = {
-                config.name: {
-                    "query": config.query,
-                    "description": config.description,
-                    "usage_example": f"--search-config {config.name}"
-                }
-                for config in configs
-            }
-        
-        # Add all examples
-        for config in examples:
-            example_data["all_examples"][config.name] = config.to_dict()
-        
-        with open(file_path, 'w') as f:
-            json.dump(example_data, f, indent=2, sort_keys=True)
+        if hasattr(file_path, 'write'):
+            json.dump(example_data, file_path, indent=2, sort_keys=True)
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(example_data, f, indent=2, sort_keys=True)
         
         return True
         
     except Exception as e:
         print(f"Error creating example config file: {e}")
-        return False
\ No newline at end of file
+        return False
@@ -4,19 +4,48 @@ This module provides data models for storing and managing custom Gmail search
 configurations, along with validation for Gmail search query syntax.
 """
 
+import hashlib
 import json
 import re
 import os
 import shutil
-from dataclasses import dataclass, field, asdict
+import sys
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
 import logging
 from utils.error_handling import (
     NonRetryableError, ErrorCategory, create_user_friendly_message,
     handle_file_system_error
 )
 
+# Use orjson for the configuration file if available
+try:
+    import orjson
+except ImportError:
+    # orjson not installed, fall back to the standard json module
+    orjson = None
+
+
+def _dumps_config(config_data: Dict[str, Any]) -> bytes:
+    """Serialize configuration data as indented, key-sorted JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(config_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(config_data, indent=2, sort_keys=True).encode('utf-8')
+
+
+def _loads_config(raw: bytes) -> Any:
+    """Parse configuration file bytes.
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    handle invalid JSON the same way with either parser.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class SearchConfigError(Exception):
     """Base exception for search configuration errors."""
@@ -25,24 +54,47 @@ class SearchConfigError(Exception):
         self.category = category
 
 
+def _not_found_message(config_name: str, available_configs: List[str]) -> str:
+    """Build the error message for a configuration that does not exist."""
+    if available_configs:
+        return (
+            f"Search configuration '{config_name}' not found. "
+            f"Available configurations: {', '.join(available_configs)}"
+        )
+    return (
+        f"Search configuration '{config_name}' not found. "
+        "No saved configurations exist. Use --save-config to create one."
+    )
+
+
 class ConfigurationNotFoundError(SearchConfigError):
     """Raised when a requested configuration is not found."""
     def __init__(self, config_name: str, available_configs: List[str] = None):
         self.config_name = config_name
         self.available_configs = available_configs or []
-        
-        if self.available_configs:
-            message = (
-                f"Search configuration '{config_name}' not found. "
-                f"Available configurations: {', '.join(self.available_configs)}"
-            )
-        else:
-            message = (
-                f"Search configuration '{config_name}' not found. "
-                "No saved configurations exist. Use --save-config to create one."
-            )
-        
-        super().__init__(message, ErrorCategory.VALIDATION)
+        super().__init__(_not_found_message(config_name, self.available_configs), ErrorCategory.VALIDATION)
+
+
+class SearchConfigNotFound(ValueError):
+    """Raised when --search-config names a configuration that does not exist.
+    
+    Subclasses ValueError, which was raised here before, so existing callers
+    keep working while new ones can read the name and available configs.
+    """
+    def __init__(self, config_name: str, available_configs: List[str] = None):
+        self.config_name = config_name
+        self.available_configs = available_configs or []
+        super().__init__(_not_found_message(config_name, sorted(self.available_configs)))
+    
+    @property
+    def name(self) -> str:
+        """Name of the missing configuration (alias of config_name)."""
+        return self.config_name
+    
+    @property
+    def available(self) -> List[str]:
+        """Saved configuration names (alias of available_configs)."""
+        return self.available_configs
 
 
 class InvalidConfigurationError(SearchConfigError):
@@ -82,7 +134,24 @@ class CorruptedConfigFileError(SearchConfigError):
         super().__init__(message, ErrorCategory.FILE_SYSTEM)
 
 
-@dataclass
+class ConfigFileConflictError(SearchConfigError):
+    """Raised when the configuration file changes while batch() changes are pending."""
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        
+        message = (
+            f"Configuration file '{file_path}' was changed by another writer "
+            "while a batch of changes was pending; the batch was not saved."
+        )
+        
+        super().__init__(message, ErrorCategory.FILE_SYSTEM)
+
+
+# dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SearchConfig:
     """Data model for a Gmail search configuration.
     
@@ -108,14 +177,16 @@ class SearchConfig:
             Dict containing all configuration data with datetime objects
             converted to ISO format strings.
         """
-        data = asdict(self)
-        # Convert datetime objects to ISO format strings
-        data['created_at'] = self.created_at.isoformat()
-        if self.last_used:
-            data['last_used'] = self.last_used.isoformat()
-        else:
-            data['last_used'] = None
-        return data
+        # Built directly rather than via asdict(), which deep-copies every
+        # field only for the datetimes to be replaced by ISO strings
+        return {
+            'name': self.name,
+            'query': self.query,
+            'description': self.description,
+            'created_at': self.created_at.isoformat(),
+            'last_used': self.last_used.isoformat() if self.last_used else None,
+            'usage_count': self.usage_count
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SearchConfig':
@@ -184,6 +255,9 @@ class QueryValidator:
         'drafts', 'important', 'chats', 'all', 'anywhere'
     ]
     
+    # Number of OR conditions above which a query is flagged as slow
+    MAX_OR_CONDITIONS = 10
+    
     # Date format patterns
     DATE_PATTERNS = [
         r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
@@ -255,24 +329,14 @@ class QueryValidator:
             return suggestions
         
         # Check for common operator misspellings
-        common_mistakes = {
-            'form:': 'from:',
-            'too:': 'to:',
-            'subjet:': 'subject:',
-            'subjct:': 'subject:',
-            'attachement:': 'has:attachment',
-            'unred:': 'is:unread',
-            'importnt:': 'is:important'
-        }
-        
-        for mistake, correction in common_mistakes.items():
+        for mistake, correction in _TYPO_MAP.items():
             if mistake in query.lower():
                 suggestions.append(f"Replace '{mistake}' with '{correction}'")
         
         # Check for unsupported operators
         operators_found = self._extract_operators(query)
         for operator, _ in operators_found:
-            if operator not in self.SUPPORTED_OPERATORS:
+            if operator not in SUPPORTED_OPERATORS_SET:
                 closest_match = self._find_closest_operator(operator)
                 if closest_match:
                     suggestions.append(f"Replace '{operator}' with '{closest_match}'")
@@ -296,11 +360,7 @@ class QueryValidator:
             List of (operator, value) tuples
         """
         operators = []
-        # Pattern to match operator:value pairs, handling quoted values and OR operators
-        pattern = r'(\w+:)("(?:[^"\\]|\\.)*"|[^\s]+)(?=\s|$)'
-        
-        matches = re.finditer(pattern, query)
-        for match in matches:
+        for match in _OPERATOR_PATTERN.finditer(query):
             operator = match.group(1)
             value = match.group(2).strip()
             # Remove quotes if present
@@ -316,20 +376,20 @@ class QueryValidator:
         Returns:
             Error message if invalid, None if valid
         """
-        if operator not in self.SUPPORTED_OPERATORS:
+        if operator not in SUPPORTED_OPERATORS_SET:
             return f"Unsupported operator: {operator}"
         
         # Validate specific operator values
         if operator == 'has:':
-            if value not in self.VALID_HAS_VALUES:
+            if value not in _VALID_HAS_VALUES_SET:
                 return f"Invalid value for has: operator: {value}"
         
         elif operator == 'is:':
-            if value not in self.VALID_IS_VALUES:
+            if value not in _VALID_IS_VALUES_SET:
                 return f"Invalid value for is: operator: {value}"
         
         elif operator == 'in:':
-            if value not in self.VALID_IN_VALUES:
+            if value not in _VALID_IN_VALUES_SET:
                 return f"Invalid value for in: operator: {value}"
         
         elif operator in ['after:', 'before:']:
@@ -348,8 +408,8 @@ class QueryValidator:
     
     def _validate_date_format(self, date_str: str) -> bool:
         """Validate date format for after:/before: operators."""
-        for pattern in self.DATE_PATTERNS[:2]:  # Only absolute date patterns
-            if re.fullmatch(pattern, date_str):
+        for pattern in _ABSOLUTE_DATE_PATTERNS:
+            if pattern.fullmatch(date_str):
                 # Additional validation for YYYY-MM-DD format
                 if '-' in date_str:
                     try:
@@ -371,11 +431,11 @@ class QueryValidator:
     
     def _validate_relative_date(self, date_str: str) -> bool:
         """Validate relative date format for older_than:/newer_than: operators."""
-        return bool(re.fullmatch(r'\d+[dmy]', date_str))
+        return _RELATIVE_DATE_PATTERN.fullmatch(date_str) is not None
     
     def _validate_size_format(self, size_str: str) -> bool:
         """Validate size format for size-related operators."""
-        return bool(re.fullmatch(r'\d+[KMGB]*', size_str, re.IGNORECASE))
+        return _SIZE_PATTERN.fullmatch(size_str) is not None
     
     def _check_for_warnings(self, query: str) -> List[str]:
         """Check for potentially problematic query patterns.
@@ -389,13 +449,15 @@ class QueryValidator:
         if len(query) > 500:
             warnings.append("Query is very long and may be slow")
         
-        # Check for too many OR conditions
-        or_count = query.lower().count(' or ')
-        if or_count > 10:
-            warnings.append("Too many OR conditions may impact performance")
+        # Check for too many OR conditions, skipping queries too short to
+        # hold more than the limit of ' or ' separators
+        if len(query) > 4 * self.MAX_OR_CONDITIONS:
+            or_count = query.lower().count(' or ')
+            if or_count > self.MAX_OR_CONDITIONS:
+                warnings.append("Too many OR conditions may impact performance")
         
         # Check for potentially inefficient patterns
-        if 'has:attachment' in query and 'larger:' not in query:
+        if 'has:attachment' in query and not any(op in query for op in ('larger:', 'smaller:', 'size:')):
             warnings.append("Consider adding size filter when searching attachments")
         
         return warnings
@@ -406,6 +468,12 @@ class QueryValidator:
         Uses simple string similarity to suggest corrections.
         """
         operator_lower = operator.lower()
+        
+        # Known misspellings of an operator resolve without scoring
+        correction = _TYPO_MAP.get(operator_lower)
+        if correction in SUPPORTED_OPERATORS_SET:
+            return correction
+        
         best_match = None
         best_score = 0
         
@@ -419,11 +487,43 @@ class QueryValidator:
         return best_match
 
 
+# Supported operators and values as sets for constant-time membership checks
+SUPPORTED_OPERATORS_SET = frozenset(QueryValidator.SUPPORTED_OPERATORS)
+_VALID_HAS_VALUES_SET = frozenset(QueryValidator.VALID_HAS_VALUES)
+_VALID_IS_VALUES_SET = frozenset(QueryValidator.VALID_IS_VALUES)
+_VALID_IN_VALUES_SET = frozenset(QueryValidator.VALID_IN_VALUES)
+
+# Patterns compiled once for the validator's hot paths.
+# operator:value pairs, handling quoted values and OR operators
+_OPERATOR_PATTERN = re.compile(r'(\w+:)("(?:[^"\\]|\\.)*"|[^\s]+)(?=\s|$)')
+# Only the absolute date patterns (YYYY-MM-DD and YYYY/MM/DD)
+_ABSOLUTE_DATE_PATTERNS = tuple(re.compile(p) for p in QueryValidator.DATE_PATTERNS[:2])
+_RELATIVE_DATE_PATTERN = re.compile(r'\d+[dmy]')
+_SIZE_PATTERN = re.compile(r'\d+[KMGB]*', re.IGNORECASE)
+
+# Common misspellings and their corrections
+_TYPO_MAP = {
+    'form:': 'from:',
+    'too:': 'to:',
+    'subjet:': 'subject:',
+    'subjct:': 'subject:',
+    'attachement:': 'has:attachment',
+    'unred:': 'is:unread',
+    'importnt:': 'is:important'
+}
+
+
 class SearchConfigManager:
     """Manager for Gmail search configurations with CRUD operations.
     
     Provides functionality to create, read, update, and delete search configurations
     with JSON file-based storage and versioning support.
+    
+    Usage statistics are appended to a ``<config_file>.usage.jsonl`` log
+    rather than rewriting the configuration file on every use. The log is
+    folded into the configuration file on its next save, or once it reaches
+    USAGE_LOG_MAX_BYTES, so other readers of the JSON file see usage counts
+    that lag by at most that many bytes of records.
     """
     
     # Configuration file format version
@@ -438,16 +538,45 @@ class SearchConfigManager:
         # "1.1": "_migrate_from_1_0_to_1_1",
     }
     
-    def __init__(self, config_file: str = "search_configs.json"):
+    # Bounds for the per-manager cache of query validation results
+    VALIDATION_CACHE_SIZE = 256
+    VALIDATION_CACHE_MAX_QUERY_LENGTH = 1024
+    
+    # Usage log size, about 40 records, at which it is folded into the file
+    USAGE_LOG_MAX_BYTES = 4096
+    
+    def __init__(self, config_file: str = "search_configs.json", durable: bool = False):
         """Initialize the search configuration manager.
         
         Args:
             config_file: Path to the JSON configuration file
+            durable: Flush each write to disk with fsync before replacing the
+                configuration file, so saves survive a power loss
         """
         self.config_file = config_file
+        self.durable = durable
+        # Usage statistics are appended here and folded into the
+        # configuration file on its next full write
+        self.usage_log_file = f"{config_file}.usage.jsonl"
         self.validator = QueryValidator()
         self.logger = logging.getLogger(__name__)
         
+        # Parsed configuration file, reused while the file on disk is unchanged
+        self._config_data: Optional[Dict[str, Any]] = None
+        self._config_stat: Optional[Tuple] = None
+        # SearchConfig objects built from _config_data, keyed by name
+        self._parsed_configs: Dict[str, SearchConfig] = {}
+        
+        # Validation results keyed by query string, oldest evicted first
+        self._validation_cache: Dict[str, Tuple[bool, str]] = {}
+        
+        # (sha1 digest of the config file, backup path) of the latest backup
+        self._last_backup: Optional[Tuple[bytes, str]] = None
+        
+        # Nesting depth of batch() blocks and whether they have unsaved changes
+        self._batch_depth = 0
+        self._batch_dirty = False
+        
         # Log initialization
         self.logger.debug(f"Initializing SearchConfigManager with config file: {config_file}")
         
@@ -474,15 +603,39 @@ class SearchConfigManager:
             CorruptedConfigFileError: If config file is corrupted
             NonRetryableError: If file system errors occur
         """
+        return self.save_configs([config])
+    
+    def save_configs(self, configs: Iterable[SearchConfig]) -> bool:
+        """Save several new search configurations with a single file write.
+        
+        Every configuration is validated before anything is written, so
+        either all of them are saved or none are.
+        
+        Args:
+            configs: SearchConfig instances to save
+            
+        Returns:
+            True if saved successfully
+            
+        Raises:
+            QueryValidationError: If a search query is invalid
+            InvalidConfigurationError: If a configuration name already exists
+                or appears more than once in the batch
+            CorruptedConfigFileError: If config file is corrupted
+            NonRetryableError: If file system errors occur
+        """
+        configs = list(configs)
+        names = [config.name for config in configs]
         try:
-            self.logger.debug(f"Attempting to save search configuration: {config.name}")
+            self.logger.debug(f"Attempting to save search configurations: {', '.join(names)}")
             
-            # Validate the search query
-            is_valid, error_msg = self.validator.validate_query(config.query)
-            if not is_valid:
-                suggestions = self.validator.suggest_corrections(config.query)
-                self.logger.warning(f"Invalid query for config '{config.name}': {error_msg}")
-                raise QueryValidationError(config.query, error_msg, suggestions)
+            # Validate the search queries
+            for config in configs:
+                is_valid, error_msg = self._validate_query_cached(config.query)
+                if not is_valid:
+                    suggestions = self.validator.suggest_corrections(config.query)
+                    self.logger.warning(f"Invalid query for config '{config.name}': {error_msg}")
+                    raise QueryValidationError(config.query, error_msg, suggestions)
             
             # Load existing configurations with error handling
             try:
@@ -492,32 +645,36 @@ class SearchConfigManager:
                 config_data = {"version": self.CONFIG_VERSION, "configs": {}}
                 self.logger.warning("Using default config structure due to corrupted file")
             
-            # Check if configuration name already exists
-            if config.name in config_data["configs"]:
-                self.logger.warning(f"Attempt to save duplicate configuration: {config.name}")
-                raise InvalidConfigurationError(
-                    f"Configuration '{config.name}' already exists. Use update_config() to modify it.",
-                    config.name,
-                    ["Use a different name", "Delete the existing configuration first", "Use update_config() instead"]
-                )
-            
-            # Add new configuration
-            config_data["configs"][config.name] = config.to_dict()
-            
-            # Save updated configurations
-            self._save_config_file(config_data)
-            
-            self.logger.info(f"Successfully saved search configuration '{config.name}' with query: {config.query}")
-            self.log_configuration_access(config.name, "save", True, f"Query: {config.query}")
+            # Check for names that already exist, in the file or earlier in the batch
+            new_configs = {}
+            for config in configs:
+                if config.name in config_data["configs"] or config.name in new_configs:
+                    self.logger.warning(f"Attempt to save duplicate configuration: {config.name}")
+                    raise InvalidConfigurationError(
+                        f"Configuration '{config.name}' already exists. Use update_config() to modify it.",
+                        config.name,
+                        ["Use a different name", "Delete the existing configuration first", "Use update_config() instead"]
+                    )
+                new_configs[config.name] = config.to_dict()
+            
+            # Add new configurations and save them in one write
+            config_data["configs"].update(new_configs)
+            self._write_config_data(config_data)
+            
+            for config in configs:
+                self.logger.info(f"Successfully saved search configuration '{config.name}' with query: {config.query}")
+                self.log_configuration_access(config.name, "save", True, f"Query: {config.query}")
             return True
             
         except (QueryValidationError, InvalidConfigurationError, CorruptedConfigFileError) as e:
             # Log the failure and re-raise our custom exceptions
-            self.log_configuration_access(config.name, "save", False, str(e))
+            for name in names:
+                self.log_configuration_access(name, "save", False, str(e))
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error saving configuration '{config.name}': {e}")
-            self.log_configuration_access(config.name, "save", False, f"Unexpected error: {str(e)}")
+            self.logger.error(f"Unexpected error saving configurations {', '.join(names)}: {e}")
+            for name in names:
+                self.log_configuration_access(name, "save", False, f"Unexpected error: {str(e)}")
             # Convert to appropriate error type
             fs_error = handle_file_system_error(e, "saving configuration", self.config_file)
             raise fs_error
@@ -548,7 +705,7 @@ class SearchConfigManager:
             config_dict = config_data["configs"][name]
             
             try:
-                config = SearchConfig.from_dict(config_dict)
+                config = self._parse_config(name, config_dict)
                 self.logger.debug(f"Successfully loaded configuration '{name}'")
                 self.log_configuration_access(name, "load", True, f"Query: {config.query}")
                 return config
@@ -605,9 +762,9 @@ class SearchConfigManager:
             config_data = self._load_config_file()
             configs = []
             
-            for config_dict in config_data["configs"].values():
+            for name, config_dict in config_data["configs"].items():
                 try:
-                    config = SearchConfig.from_dict(config_dict)
+                    config = self._parse_config(name, config_dict)
                     configs.append(config)
                 except ValueError as e:
                     self.logger.warning(f"Skipping invalid configuration: {e}")
@@ -643,7 +800,7 @@ class SearchConfigManager:
             del config_data["configs"][name]
             
             # Save updated configurations
-            self._save_config_file(config_data)
+            self._write_config_data(config_data)
             
             self.logger.info(f"Deleted search configuration: {name}")
             return True
@@ -667,7 +824,7 @@ class SearchConfigManager:
         """
         try:
             # Validate the search query
-            is_valid, error_msg = self.validator.validate_query(config.query)
+            is_valid, error_msg = self._validate_query_cached(config.query)
             if not is_valid:
                 suggestions = self.validator.suggest_corrections(config.query)
                 raise QueryValidationError(config.query, error_msg, suggestions)
@@ -689,7 +846,7 @@ class SearchConfigManager:
             config_data["configs"][name] = config_dict
             
             # Save updated configurations
-            self._save_config_file(config_data)
+            self._write_config_data(config_data)
             
             self.logger.info(f"Updated search configuration: {name}")
             return True
@@ -719,11 +876,20 @@ class SearchConfigManager:
             # Update usage statistics
             config_dict = config_data["configs"][name]
             old_count = config_dict.get("usage_count", 0)
-            config_dict["usage_count"] = old_count + 1
-            config_dict["last_used"] = datetime.now().isoformat()
+            last_used = datetime.now().isoformat()
             
-            # Save updated configurations
-            self._save_config_file(config_data)
+            if self._batch_depth:
+                config_dict["usage_count"] = old_count + 1
+                config_dict["last_used"] = last_used
+                self._write_config_data(config_data)
+            else:
+                # Append to the usage log instead of rewriting the whole
+                # file. Another process may have written since the load, so
+                # drop the cached data rather than stamping it as current.
+                log_size = self._append_usage_record(name, old_count + 1, last_used)
+                self._cache_config_data(None, None)
+                if log_size >= self.USAGE_LOG_MAX_BYTES:
+                    self._save_config_file(self._load_config_file())
             
             self.logger.info(f"Updated usage stats for configuration '{name}': usage count {old_count} -> {old_count + 1}")
             return True
@@ -736,6 +902,41 @@ class SearchConfigManager:
             self.logger.error(f"Unexpected error updating usage stats for '{name}': {e}")
             return False
     
+    @contextmanager
+    def batch(self) -> Iterator['SearchConfigManager']:
+        """Group several changes into a single write of the configuration file.
+        
+        Inside the block, saves, updates, deletes and usage statistics are
+        applied to the in-memory configuration data, which is written once
+        when the outermost block exits. If the block raises, the pending
+        changes are discarded.
+        
+        Yields:
+            This manager
+            
+        Raises:
+            ConfigFileConflictError: If the configuration file changed on disk
+                while changes were pending; they are discarded, not saved
+        """
+        self._batch_depth += 1
+        completed = False
+        try:
+            yield self
+            completed = True
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                if completed and not self._config_file_changed():
+                    self._save_config_file(self._config_data)
+                elif completed:
+                    # Saving would overwrite the other writer's changes
+                    self._cache_config_data(None, None)
+                    raise ConfigFileConflictError(self.config_file)
+                else:
+                    # Drop the pending changes so the next read comes from disk
+                    self._cache_config_data(None, None)
+    
     def validate_query(self, query: str) -> Tuple[bool, str]:
         """Validate a Gmail search query.
         
@@ -745,7 +946,32 @@ class SearchConfigManager:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        return self.validator.validate_query(query)
+        return self._validate_query_cached(query)
+    
+    def _validate_query_cached(self, query: str) -> Tuple[bool, str]:
+        """Validate a query, reusing the result for queries seen before.
+        
+        Validation is a pure function of the query string, so results are
+        kept in a bounded cache. Very long queries are validated without
+        being cached to keep memory use bounded.
+        
+        Args:
+            query: Gmail search query string
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        cached = self._validation_cache.get(query)
+        if cached is not None:
+            return cached
+        
+        result = self.validator.validate_query(query)
+        if isinstance(query, str) and len(query) <= self.VALIDATION_CACHE_MAX_QUERY_LENGTH:
+            if len(self._validation_cache) >= self.VALIDATION_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._validation_cache[next(iter(self._validation_cache))]
+            self._validation_cache[query] = result
+        return result
     
     def get_config_stats(self) -> Dict[str, Any]:
         """Get statistics about saved configurations.
@@ -840,8 +1066,9 @@ class SearchConfigManager:
                 self._create_default_config_file()
                 return
             
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
+            stat_key = self._stat_config_file()
+            with open(self.config_file, 'rb') as f:
+                config_data = _loads_config(f.read())
                 
             # Check if migration is needed
             current_version = config_data.get("version", "0.0")
@@ -849,11 +1076,14 @@ class SearchConfigManager:
                 self.logger.info(f"Configuration file needs migration from {current_version} to {self.CONFIG_VERSION}")
                 
                 # Create backup before migration
-                backup_path = self._create_backup(self.config_file)
+                backup_path = self._create_backup()
                 self.logger.info(f"Created backup at: {backup_path}")
                 
                 migrated_data = self._migrate_config_file(config_data, current_version)
                 if migrated_data:
+                    # Saving drops the usage log, so fold its records in first
+                    if isinstance(migrated_data.get("configs"), dict):
+                        self._replay_usage_log(migrated_data)
                     self._save_config_file(migrated_data)
                     self.logger.info(f"Successfully migrated configuration from {current_version} to {self.CONFIG_VERSION}")
                 else:
@@ -867,6 +1097,13 @@ class SearchConfigManager:
             # Validate structure for current version
             if "version" not in config_data or "configs" not in config_data:
                 raise ValueError("Invalid configuration file structure")
+            
+            if not isinstance(config_data["configs"], dict):
+                raise ValueError("'configs' section must be a JSON object")
+            
+            # Seed the in-memory copy so the first read skips a second parse
+            self._replay_usage_log(config_data)
+            self._cache_config_data(config_data, stat_key)
                 
         except FileNotFoundError:
             self.logger.info(f"Creating new configuration file: {self.config_file}")
@@ -927,9 +1164,123 @@ class SearchConfigManager:
         # Always raise the corruption error to inform the caller
         raise CorruptedConfigFileError(self.config_file, original_error, backup_path)
     
+    def _cache_config_data(self, config_data: Optional[Dict[str, Any]],
+                           stat_key: Optional[Tuple]):
+        """Replace the in-memory configuration data and its parsed configs.
+        
+        Args:
+            config_data: Parsed configuration file, or None to drop the cache
+            stat_key: Stat key of the file the data matches
+        """
+        self._config_data = config_data
+        self._config_stat = stat_key
+        self._parsed_configs.clear()
+    
+    def _parse_config(self, name: str, config_dict: Dict[str, Any]) -> SearchConfig:
+        """Return the SearchConfig for a cached configuration entry.
+        
+        Args:
+            name: Name of the configuration
+            config_dict: Stored dictionary for the configuration
+            
+        Parsing happens once until the configuration data changes; callers
+        get their own copy, so changing it leaves the cached instance intact.
+        
+        Returns:
+            New SearchConfig instance
+            
+        Raises:
+            ValueError: If the stored data is invalid
+        """
+        config = self._parsed_configs.get(name)
+        if config is None:
+            config = SearchConfig.from_dict(config_dict)
+            self._parsed_configs[name] = config
+        # Every field is immutable, so a shallow copy is independent
+        return replace(config)
+    
+    def _stat_config_file(self) -> Tuple:
+        """Return the key identifying the config file and usage log on disk.
+        
+        A rewrite that keeps the same size and inode and lands within the
+        filesystem's mtime resolution leaves the key unchanged, so it is not
+        noticed until the file changes again. This is a known limit of the
+        cache. Saves made here create the new file while the old one still
+        exists, so each one gets a different inode from the file it replaces;
+        the limit applies to in-place edits and to an inode reused across
+        two quick saves.
+        
+        Returns:
+            Tuple of the config file's (mtime_ns, size, inode) and the usage
+            log's (mtime_ns, size), or None when there is no usage log
+        """
+        st = os.stat(self.config_file)
+        try:
+            log_st = os.stat(self.usage_log_file)
+            log_key = (log_st.st_mtime_ns, log_st.st_size)
+        except FileNotFoundError:
+            log_key = None
+        return st.st_mtime_ns, st.st_size, st.st_ino, log_key
+    
+    def _config_file_changed(self) -> bool:
+        """Check whether the file on disk differs from the cached data."""
+        try:
+            return self._stat_config_file() != self._config_stat
+        except FileNotFoundError:
+            return True
+    
+    def _append_usage_record(self, name: str, usage_count: int, last_used: str):
+        """Append a usage statistics record to the usage log.
+        
+        Records hold absolute values, so replaying one twice is harmless.
+        
+        Args:
+            name: Name of the configuration
+            usage_count: New usage count
+            last_used: ISO timestamp of the last use
+            
+        Returns:
+            Size of the usage log in bytes after the append
+        """
+        record = json.dumps({"name": name, "usage_count": usage_count, "last_used": last_used})
+        with open(self.usage_log_file, 'a', encoding='utf-8') as f:
+            f.write(record + "\n")
+            if self.durable:
+                f.flush()
+                os.fsync(f.fileno())
+            return f.tell()
+    
+    def _replay_usage_log(self, config_data: Dict[str, Any]):
+        """Apply the usage log records to freshly parsed configuration data.
+        
+        Args:
+            config_data: Configuration data read from the config file
+        """
+        try:
+            with open(self.usage_log_file, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        
+        for line in lines:
+            try:
+                record = _loads_config(line)
+                config_dict = config_data["configs"].get(record["name"])
+                if isinstance(config_dict, dict):
+                    config_dict["usage_count"] = record["usage_count"]
+                    config_dict["last_used"] = record["last_used"]
+            except (ValueError, KeyError, TypeError):
+                # Skip a record torn by an interrupted append
+                self.logger.warning(f"Skipping invalid usage log record in {self.usage_log_file}")
+    
     def _load_config_file(self) -> Dict[str, Any]:
         """Load configuration data from JSON file.
         
+        The parsed data is kept in memory and reused until the file's stat
+        key changes, so repeated reads skip the open and JSON parse while
+        changes made by other processes are still picked up (see
+        _stat_config_file for the one case that is missed).
+        
         Returns:
             Dictionary containing configuration data
             
@@ -937,9 +1288,18 @@ class SearchConfigManager:
             CorruptedConfigFileError: If file is corrupted or has invalid format
             NonRetryableError: If file system errors occur
         """
+        # Pending batch() changes exist only in memory; rereading the file
+        # would drop them, so a conflicting change is reported on exit
+        if self._batch_dirty:
+            return self._config_data
+        
         try:
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
+            stat_key = self._stat_config_file()
+            if self._config_data is not None and stat_key == self._config_stat:
+                return self._config_data
+            
+            with open(self.config_file, 'rb') as f:
+                config_data = _loads_config(f.read())
             
             # Validate basic structure
             if not isinstance(config_data, dict):
@@ -951,6 +1311,8 @@ class SearchConfigManager:
             if not isinstance(config_data["configs"], dict):
                 raise ValueError("'configs' section must be a JSON object")
             
+            self._replay_usage_log(config_data)
+            self._cache_config_data(config_data, stat_key)
             return config_data
             
         except FileNotFoundError:
@@ -969,30 +1331,106 @@ class SearchConfigManager:
             fs_error = handle_file_system_error(e, "loading configuration file", self.config_file)
             raise fs_error
     
+    def _write_config_data(self, config_data: Dict[str, Any]):
+        """Persist changed configuration data, deferring the write inside batch().
+        
+        Args:
+            config_data: Dictionary containing configuration data
+        """
+        if self._batch_depth:
+            self._cache_config_data(config_data, self._config_stat)
+            self._batch_dirty = True
+        else:
+            self._save_config_file(config_data)
+    
     def _save_config_file(self, config_data: Dict[str, Any]):
         """Save configuration data to JSON file.
         
+        The data is written to a uniquely named temporary file in the same
+        directory that then replaces the configuration file, so readers never
+        see a partially written file and concurrent writers never share a
+        temporary file. The configuration file keeps its permissions. The
+        temporary file is only fsynced when the manager is durable.
+        
         Args:
             config_data: Dictionary containing configuration data
             
         Raises:
             Exception: If file cannot be written
         """
+        tmp_file = None
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2, sort_keys=True)
+            fd, tmp_file = tempfile.mkstemp(
+                dir=os.path.dirname(self.config_file) or ".",
+                prefix=f"{os.path.basename(self.config_file)}.",
+                suffix=".tmp"
+            )
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_dumps_config(config_data))
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            
+            # mkstemp creates the file owner-only; keep the existing mode
+            try:
+                shutil.copymode(self.config_file, tmp_file)
+            except FileNotFoundError:
+                pass
+            
+            os.replace(tmp_file, self.config_file)
+            
+            # The written data includes every logged usage update
+            try:
+                os.remove(self.usage_log_file)
+            except FileNotFoundError:
+                pass
+            
+            self._cache_config_data(config_data, self._stat_config_file())
         except Exception as e:
+            # Callers mutate the cached data before saving; drop it so the
+            # next read comes from disk
+            self._cache_config_data(None, None)
+            if tmp_file is not None:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
             self.logger.error(f"Failed to save configuration file: {e}")
             raise
     
-    def _create_backup(self, backup_file: str):
+    def _create_backup(self, backup_file: Optional[str] = None) -> str:
         """Create a backup of the current configuration file.
         
+        If the file is unchanged since this manager's latest backup and that
+        backup still exists, it is reused instead of copying the file again,
+        unless a different backup path is requested.
+        
         Args:
-            backup_file: Path for the backup file
+            backup_file: Path for the backup file, or None for a timestamped
+                path next to the configuration file
+            
+        Returns:
+            Path to the backup file
         """
-        import shutil
-        shutil.copy2(self.config_file, backup_file)
+        try:
+            with open(self.config_file, 'rb') as f:
+                digest = hashlib.sha1(f.read()).digest()
+            if self._last_backup is not None:
+                last_digest, last_path = self._last_backup
+                if (digest == last_digest and backup_file in (None, last_path)
+                        and os.path.exists(last_path)):
+                    self.logger.debug(f"Configuration unchanged since backup {last_path}, skipping copy")
+                    return last_path
+            
+            if backup_file is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                backup_file = f"{self.config_file}.backup_{timestamp}"
+            shutil.copy2(self.config_file, backup_file)
+            self._last_backup = (digest, backup_file)
+            return backup_file
+        except Exception as e:
+            self.logger.error(f"Failed to create backup: {e}")
+            raise
     
     def _migrate_from_v0_to_v1(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
         """Migrate configuration from version 0.0 to 1.0.
@@ -1198,8 +1636,8 @@ class SearchConfigManager:
             if not os.path.exists(self.config_file):
                 return  # Nothing to migrate
             
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                config_data = _loads_config(f.read())
             
             current_version = config_data.get("version", "0.0")
             
@@ -1207,13 +1645,16 @@ class SearchConfigManager:
                 self.logger.info(f"Configuration file migration needed: {current_version} -> {self.CONFIG_VERSION}")
                 
                 # Create backup before migration
-                backup_path = self._create_backup(self.config_file)
+                backup_path = self._create_backup()
                 self.logger.info(f"Created backup at: {backup_path}")
                 
                 # Perform migration
                 migrated_data = self._migrate_config_file(config_data, current_version)
                 
                 if migrated_data:
+                    # Saving drops the usage log, so fold its records in first
+                    if isinstance(migrated_data.get("configs"), dict):
+                        self._replay_usage_log(migrated_data)
                     self._save_config_file(migrated_data)
                     self.logger.info("Configuration file migration completed successfully")
                 else:
@@ -1228,25 +1669,6 @@ class SearchConfigManager:
         except Exception as e:
             self.logger.warning(f"Error during configuration file migration check: {e}")
     
-    def _create_backup(self, file_path: str) -> str:
-        """Create a backup of the configuration file.
-        
-        Args:
-            file_path: Path to the file to backup
-            
-        Returns:
-            Path to the backup file
-        """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = f"{file_path}.backup_{timestamp}"
-        
-        try:
-            shutil.copy2(file_path, backup_path)
-            return backup_path
-        except Exception as e:
-            self.logger.error(f"Failed to create backup: {e}")
-            raise
-    
     def is_search_feature_available(self) -> bool:
         """Check if search configuration features are available.
         
@@ -1262,8 +1684,8 @@ class SearchConfigManager:
                 return True  # File will be created when needed
             
             # Try to read the configuration file
-            with open(self.config_file, 'r') as f:
-                config_data = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                config_data = _loads_config(f.read())
             
             # Check if it has the expected structure
             if "version" not in config_data or "configs" not in config_data:
@@ -1299,8 +1721,8 @@ class SearchConfigManager:
             
             if info["config_file_exists"]:
                 try:
-                    with open(self.config_file, 'r') as f:
-                        config_data = json.load(f)
+                    with open(self.config_file, 'rb') as f:
+                        config_data = _loads_config(f.read())
                     
                     info["config_file_version"] = config_data.get("version", "0.0")
                     info["migration_needed"] = info["config_file_version"] != self.CONFIG_VERSION
@@ -0,0 +1,67 @@
+"""Shared pytest configuration for the test suite.
+
+Tests marked ``slow`` (filesystem-heavy permission, migration and recovery
+checks) are skipped unless ``--run-slow`` is given, so the default run stays
+fast during development:
+
+    python -m pytest                 # fast lane
+    python -m pytest --run-slow      # full run
+
+It also provides session-wide, read-only fixtures for the transcript
+generator tests.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Add the --run-slow command line option."""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="also run tests marked as slow"
+    )
+
+
+def pytest_configure(config):
+    """Register custom markers used by the tests."""
+    config.addinivalue_line(
+        "markers", "slow: filesystem-heavy test (permissions, migration, recovery)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow was given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test; use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def transcript_config():
+    """Configuration for transcript generator tests.
+    
+    Attributes are only read, so a plain namespace is enough. Tests that
+    need a different value build their own configuration.
+    """
+    return SimpleNamespace(
+        ai_provider="openai",
+        openai_api_key="test-key",
+        openai_model="gpt-3.5-turbo",
+        claude_model="claude-3-sonnet-20240229",
+        max_tokens=1000,
+        temperature=0.7,
+        transcript_max_tokens=1000,
+        transcript_temperature=0.7
+    )
+
+
+@pytest.fixture(scope="session")
+def transcript_generator(transcript_config):
+    """Transcript generator without an AI service, for read-only tests."""
+    from summarization.transcript_generator import TranscriptGenerator
+    return TranscriptGenerator(transcript_config, None)
@@ -8,6 +8,7 @@ specifically filtering for important unread emails and extracting their content.
 import logging
 import base64
 import re
+from itertools import islice
 from typing import List, Dict, Optional, Any, Tuple
 from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
@@ -48,6 +49,10 @@ class EmailFetcher:
     VALID_HAS_VALUES = ['attachment', 'nouserlabels', 'userlabels', 'yellow-star', 'blue-info', 'red-bang', 'orange-guillemet', 'red-star', 'purple-star', 'green-star']
     VALID_IN_VALUES = ['inbox', 'trash', 'spam', 'unread', 'starred', 'sent', 'draft', 'important', 'chats', 'all', 'anywhere']
     
+    # Requests per HTTP batch. Gmail accepts up to 100 but throttles large
+    # batches, and recommends no more than 50.
+    BATCH_SIZE = 50
+    
     def __init__(self, gmail_service: Resource):
         """
         Initialize the EmailFetcher with a Gmail service object.
@@ -192,25 +197,8 @@ class EmailFetcher:
             
             self.logger.info(f"Found {len(message_ids)} emails matching query: {query}")
             
-            # Fetch full content for each email
-            emails = []
-            failed_count = 0
-            
-            for i, message_id in enumerate(message_ids):
-                try:
-                    self.logger.debug(f"Fetching email {i+1}/{len(message_ids)}: {message_id}")
-                    email_content = self.get_email_content(message_id)
-                    if email_content:
-                        emails.append(email_content)
-                except (RetryableError, NonRetryableError) as e:
-                    failed_count += 1
-                    self.logger.warning(f"Failed to fetch email {message_id}: {e}")
-                    # Continue with other emails rather than failing completely
-                    continue
-                except Exception as e:
-                    failed_count += 1
-                    self.logger.warning(f"Unexpected error fetching email {message_id}: {e}")
-                    continue
+            # Fetch full content for all emails in batched requests
+            emails, failed_count = self._fetch_email_contents(message_ids)
             
             if failed_count > 0:
                 self.logger.warning(f"Failed to fetch {failed_count} out of {len(message_ids)} emails")
@@ -330,6 +318,80 @@ class EmailFetcher:
             self.logger.error(f"Unexpected error getting message IDs: {e}")
             raise RetryableError(f"Unexpected error getting message IDs: {e}", ErrorCategory.UNKNOWN)
     
+    def _fetch_email_contents(self, message_ids: List[str]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Retrieve full email content for many message IDs using Gmail batch requests.
+        
+        Messages are requested in HTTP batches of up to BATCH_SIZE, so N emails
+        cost one round trip per batch instead of one per message. Messages that
+        fail inside a batch, or every message of a batch whose request fails as
+        a whole, are retried individually through get_email_content().
+        
+        Args:
+            message_ids: Gmail message IDs to fetch
+            
+        Returns:
+            Tuple of (emails in message_ids order, number of failed messages)
+        """
+        results = {}
+        retry_ids = []
+        
+        def handle_response(request_id, response, exception):
+            if exception is None:
+                try:
+                    email_data = self._extract_email_data(response)
+                except Exception as e:
+                    self.logger.debug(f"Could not parse batched message {request_id}, retrying individually: {e}")
+                    retry_ids.append(request_id)
+                    return
+                email_data['message_id'] = request_id
+                results[request_id] = email_data
+            elif isinstance(exception, HttpError) and exception.resp.status == 404:
+                self.logger.warning(f"Message {request_id} not found (may have been deleted)")
+            else:
+                self.logger.debug(f"Batch fetch failed for {request_id}, retrying individually: {exception}")
+                retry_ids.append(request_id)
+        
+        ids = iter(message_ids)
+        while True:
+            chunk = list(islice(ids, self.BATCH_SIZE))
+            if not chunk:
+                break
+            
+            self.logger.debug(f"Fetching batch of {len(chunk)} emails")
+            batch = self.service.new_batch_http_request(callback=handle_response)
+            for message_id in chunk:
+                batch.add(
+                    self.service.users().messages().get(userId='me', id=message_id, format='full'),
+                    request_id=message_id
+                )
+            try:
+                batch.execute()
+            except Exception as e:
+                # Retry the messages this batch did not deliver one by one
+                self.logger.warning(f"Batch request failed, fetching {len(chunk)} emails individually: {e}")
+                pending = set(retry_ids)
+                retry_ids.extend(
+                    message_id for message_id in chunk
+                    if message_id not in results and message_id not in pending
+                )
+        
+        failed_count = 0
+        for message_id in retry_ids:
+            try:
+                email_content = self.get_email_content(message_id)
+                if email_content:
+                    results[message_id] = email_content
+            except (RetryableError, NonRetryableError) as e:
+                failed_count += 1
+                self.logger.warning(f"Failed to fetch email {message_id}: {e}")
+            except Exception as e:
+                failed_count += 1
+                self.logger.warning(f"Unexpected error fetching email {message_id}: {e}")
+        
+        emails = [results[message_id] for message_id in message_ids if message_id in results]
+        return emails, failed_count
+    
     @retry_with_backoff(
         config=RetryConfig(max_attempts=3, base_delay=0.5, max_delay=15.0),
         retryable_exceptions=(RetryableError,),
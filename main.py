@@ -18,7 +18,7 @@ from config.settings import load_config, validate_gmail_credentials, ensure_outp
 from config.search_configs import (
     SearchConfigManager, SearchConfig, SearchConfigError,
     ConfigurationNotFoundError, InvalidConfigurationError,
-    QueryValidationError, CorruptedConfigFileError
+    QueryValidationError, CorruptedConfigFileError, SearchConfigNotFound
 )
 from config.example_configs import GmailSearchHelp, ExampleConfigurations
 from auth.gmail_auth import GmailAuthError
@@ -673,8 +673,8 @@ def determine_search_query(args, config) -> str:
             
         except ConfigurationNotFoundError as e:
             logger.error(str(e))
-            # Convert to ValueError for backward compatibility
-            raise ValueError(str(e))
+            # SearchConfigNotFound is a ValueError for backward compatibility
+            raise SearchConfigNotFound(e.config_name, e.available_configs)
         except CorruptedConfigFileError as e:
             logger.error(f"Configuration file is corrupted: {e}")
             logger.info("Falling back to default search query")
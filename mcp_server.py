@@ -32,7 +32,7 @@ from fastmcp import FastMCP
 sys.path.insert(0, str(Path(__file__).parent))
 
 # Import application modules
-from config.settings import load_config, validate_gmail_credentials
+from config.settings import Config, load_config, validate_gmail_credentials
 from config.search_configs import SearchConfigManager, SearchConfig, SearchConfigError
 from auth.gmail_auth import GmailAuthError
 from gmail_email.fetcher import create_email_fetcher, EmailFetchError
@@ -65,8 +65,8 @@ logger = logging.getLogger(__name__)
 mcp = FastMCP("Gmail Email Summarizer 📧")
 
 # Global configuration and managers
-config = None
-search_manager = None
+config: Optional[Config] = None
+search_manager: Optional[SearchConfigManager] = None
 
 def initialize_services():
     """Initialize the configuration and search manager."""
@@ -458,8 +458,8 @@ async def get_status() -> Dict[str, Any]:
         if config:
             status["services"]["config"] = {
                 "status": "loaded",
-                "ai_provider": getattr(config, 'ai_provider', 'unknown'),
-                "output_dir": getattr(config, 'output_dir', 'unknown')
+                "ai_provider": config.ai_provider,
+                "output_dir": config.output_directory
             }
         else:
             status["services"]["config"] = {"status": "not_loaded"}
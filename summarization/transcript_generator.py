@@ -8,15 +8,107 @@ from existing email summaries, creating script-like content suitable for AI voic
 import logging
 import re
 import yaml
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
-from pathlib import Path
 
 from config.settings import Config
 from utils.error_handling import (
     RetryableError, NonRetryableError, ErrorCategory
 )
 
+# Prefer the libyaml-backed loader; fall back when PyYAML lacks libyaml
+try:
+    from yaml import CSafeLoader
+except ImportError:
+    from yaml import SafeLoader as CSafeLoader
+
+# Paired markdown bold, italic and code markers that would be read aloud
+# literally. The text must hug the markers, so a lone '*' or backtick (as in
+# "5 * 3") is kept as content.
+_MARKDOWN_PATTERN = re.compile(
+    r'\*\*(?=\S)(.+?)(?<=\S)\*\*|\*(?=\S)([^*\n]+?)(?<=\S)\*|`([^`\n]+)`'
+)
+
+# Patterns compiled once for transcript formatting.
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+# Sentence end followed by the start of the next sentence
+_SENTENCE_PATTERN = re.compile(r'([.!?])\s*([A-Z])')
+# Email address part of a "Name <address>" sender
+_SENDER_ADDRESS_PATTERN = re.compile(r'\s*<.*?>')
+
+# Opening of the transcript prompt, followed by the email summaries
+_PROMPT_HEADER = (
+    "Create a conversational transcript for an AI host to read aloud as a "
+    "daily email briefing for {date}.\n\nEmail Summaries:"
+)
+
+# Instructions closing every transcript prompt
+_PROMPT_GUIDELINES = """Guidelines:
+- Use natural, conversational language suitable for audio presentation
+- Create smooth transitions between different emails using phrases like "Let me tell you about...", "Moving on to...", "Next up..."
+- Group related emails logically when possible
+- Maintain a professional but friendly tone throughout
+- Include a brief opening greeting and closing
+- Consolidate action items at the end in a clear summary
+- Keep the total length appropriate for a 2-3 minute audio briefing
+- Use present tense and direct address ("you have", "you need to")
+- Make it sound natural when read aloud, avoiding awkward phrasing
+
+Format as a complete script that flows naturally when read by an AI voice assistant. Start with a greeting and end with a closing statement."""
+
+
+def _format_prompt_email(index: int, email: Dict[str, Any]) -> str:
+    """Format one email summary as a numbered section of the transcript prompt."""
+    return (
+        f"Email {index}:\n"
+        f"Subject: {email.get('subject', 'No subject')}\n"
+        f"From: {email.get('sender', 'Unknown sender')}\n"
+        f"Summary: {email.get('summary', 'No summary available')}\n"
+        f"Key Points: {', '.join(email.get('key_points', []))}\n"
+        f"Action Items: {', '.join(email.get('action_items', []))}\n"
+        f"Priority: {email.get('priority', 'Medium')}"
+    ).strip()
+
+
+def _parse_date(date: Union[str, datetime]) -> datetime:
+    """Return ``date`` as a datetime, parsing YYYY-MM-DD strings.
+    
+    Raises:
+        ValueError: If a date string is not in YYYY-MM-DD format
+    """
+    if isinstance(date, str):
+        return datetime.strptime(date, '%Y-%m-%d')
+    return date
+
+
+def _iso_date(date: Union[str, datetime]) -> str:
+    """Return ``date`` as a YYYY-MM-DD string; strings are passed through."""
+    if isinstance(date, str):
+        return date
+    return date.strftime('%Y-%m-%d')
+
+
+@lru_cache(maxsize=64)
+def _pretty_date(date: Union[str, datetime]) -> str:
+    """Format a date for speech, e.g. "September 19, 2025".
+    
+    Raises:
+        ValueError: If a date string is not in YYYY-MM-DD format
+    """
+    return _parse_date(date).strftime('%B %d, %Y')
+
+
+@lru_cache(maxsize=64)
+def _weekday(date: Union[str, datetime]) -> str:
+    """Return the weekday name of a date, e.g. "Friday".
+    
+    Raises:
+        ValueError: If a date string is not in YYYY-MM-DD format
+    """
+    return _parse_date(date).strftime('%A')
+
 
 class TranscriptGenerator:
     """Handles AI-powered transcript generation from email summaries."""
@@ -45,13 +137,13 @@ class TranscriptGenerator:
                 self.logger.warning(f"Failed to initialize EmailSummarizer: {e}")
                 self.summarizer = None
     
-    def generate_transcript(self, yaml_file_path: str, date: str) -> str:
+    def generate_transcript(self, yaml_file_path: str, date: Union[str, datetime]) -> str:
         """
         Generate a conversational transcript from email summaries in a YAML file.
         
         Args:
             yaml_file_path: Path to the YAML file containing email summaries
-            date: Date string for the transcript (YYYY-MM-DD format)
+            date: Date of the transcript, as a datetime or a YYYY-MM-DD string
             
         Returns:
             str: Generated transcript content
@@ -60,11 +152,11 @@ class TranscriptGenerator:
             NonRetryableError: If YAML file cannot be read or parsed, or transcript generation fails completely
         """
         try:
-            self.logger.info(f"Generating transcript for date: {date}")
+            self.logger.info(f"Generating transcript for date: {_iso_date(date)}")
             
             # Validate date format early
             try:
-                datetime.strptime(date, '%Y-%m-%d')
+                _pretty_date(date)
             except ValueError as e:
                 raise NonRetryableError(
                     f"Invalid date format '{date}'. Expected YYYY-MM-DD format",
@@ -124,42 +216,58 @@ class TranscriptGenerator:
             NonRetryableError: If file cannot be read or parsed
         """
         try:
-            yaml_path = Path(yaml_file_path)
-            if not yaml_path.exists():
-                raise NonRetryableError(
-                    f"YAML file not found: {yaml_file_path}",
-                    ErrorCategory.VALIDATION
-                )
-            
-            with open(yaml_path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
-            
-            if not data or 'emails' not in data:
-                self.logger.warning(f"No emails found in YAML file: {yaml_file_path}")
-                return []
-            
-            emails = data['emails']
-            self.logger.debug(f"Loaded {len(emails)} email summaries from {yaml_file_path}")
-            return emails
-            
-        except yaml.YAMLError as e:
+            with open(yaml_file_path, 'r', encoding='utf-8') as file:
+                return self._load_email_summaries_from_stream(file, yaml_file_path)
+        except FileNotFoundError:
             raise NonRetryableError(
-                f"Failed to parse YAML file {yaml_file_path}: {e}",
+                f"YAML file not found: {yaml_file_path}",
                 ErrorCategory.VALIDATION
             )
+        except NonRetryableError:
+            raise
         except Exception as e:
             raise NonRetryableError(
                 f"Failed to read YAML file {yaml_file_path}: {e}",
                 ErrorCategory.VALIDATION
             )
     
-    def _generate_ai_transcript(self, summaries: List[Dict[str, Any]], date: str) -> str:
+    def _load_email_summaries_from_stream(self, stream, source: str = "<stream>") -> List[Dict[str, Any]]:
+        """
+        Load email summaries from an open YAML text stream.
+        
+        Args:
+            stream: File-like object containing the YAML document
+            source: Name of the stream used in log and error messages
+            
+        Returns:
+            List of email summary dictionaries
+            
+        Raises:
+            NonRetryableError: If the YAML cannot be parsed
+        """
+        try:
+            data = yaml.load(stream, Loader=CSafeLoader)
+        except yaml.YAMLError as e:
+            raise NonRetryableError(
+                f"Failed to parse YAML file {source}: {e}",
+                ErrorCategory.VALIDATION
+            )
+        
+        if not data or 'emails' not in data:
+            self.logger.warning(f"No emails found in YAML file: {source}")
+            return []
+        
+        emails = data['emails']
+        self.logger.debug(f"Loaded {len(emails)} email summaries from {source}")
+        return emails
+    
+    def _generate_ai_transcript(self, summaries: List[Dict[str, Any]], date: Union[str, datetime]) -> str:
         """
         Generate a conversational transcript using AI services.
         
         Args:
             summaries: List of email summary dictionaries
-            date: Date string for the transcript
+            date: Date of the transcript, as a datetime or a YYYY-MM-DD string
             
         Returns:
             str: AI-generated transcript content
@@ -202,52 +310,22 @@ class TranscriptGenerator:
                     ErrorCategory.VALIDATION
                 )
     
-    def _create_transcript_prompt(self, summaries: List[Dict[str, Any]], date: str) -> str:
+    def _create_transcript_prompt(self, summaries: List[Dict[str, Any]], date: Union[str, datetime]) -> str:
         """
         Create an AI prompt for conversational transcript generation.
         
         Args:
             summaries: List of email summary dictionaries
-            date: Date string for the transcript
+            date: Date of the transcript, as a datetime or a YYYY-MM-DD string
             
         Returns:
             str: Formatted prompt for AI service
         """
-        # Format email summaries for the prompt
-        email_sections = []
-        for i, email in enumerate(summaries, 1):
-            section = f"""
-Email {i}:
-Subject: {email.get('subject', 'No subject')}
-From: {email.get('sender', 'Unknown sender')}
-Summary: {email.get('summary', 'No summary available')}
-Key Points: {', '.join(email.get('key_points', []))}
-Action Items: {', '.join(email.get('action_items', []))}
-Priority: {email.get('priority', 'Medium')}
-"""
-            email_sections.append(section.strip())
-        
-        email_content = '\n\n'.join(email_sections)
+        email_content = '\n\n'.join(
+            _format_prompt_email(i, email) for i, email in enumerate(summaries, 1)
+        )
         
-        prompt = f"""Create a conversational transcript for an AI host to read aloud as a daily email briefing for {date}.
-
-Email Summaries:
-{email_content}
-
-Guidelines:
-- Use natural, conversational language suitable for audio presentation
-- Create smooth transitions between different emails using phrases like "Let me tell you about...", "Moving on to...", "Next up..."
-- Group related emails logically when possible
-- Maintain a professional but friendly tone throughout
-- Include a brief opening greeting and closing
-- Consolidate action items at the end in a clear summary
-- Keep the total length appropriate for a 2-3 minute audio briefing
-- Use present tense and direct address ("you have", "you need to")
-- Make it sound natural when read aloud, avoiding awkward phrasing
-
-Format as a complete script that flows naturally when read by an AI voice assistant. Start with a greeting and end with a closing statement."""
-
-        return prompt
+        return f"{_PROMPT_HEADER.format(date=_iso_date(date))}\n{email_content}\n\n{_PROMPT_GUIDELINES}"
     
     def _format_transcript_content(self, ai_response: str) -> str:
         """
@@ -259,30 +337,26 @@ Format as a complete script that flows naturally when read by an AI voice assist
         Returns:
             str: Formatted transcript content
         """
-        # Clean up the response
-        transcript = ai_response.strip()
-        
-        # Remove any markdown formatting that might interfere with speech
-        transcript = re.sub(r'\*\*(.*?)\*\*', r'\1', transcript)  # Remove bold
-        transcript = re.sub(r'\*(.*?)\*', r'\1', transcript)      # Remove italic
-        transcript = re.sub(r'`(.*?)`', r'\1', transcript)        # Remove code formatting
+        # Remove paired bold, italic and code markers that might interfere with
+        # speech, then clean up the whitespace they leave behind
+        transcript = _MARKDOWN_PATTERN.sub(lambda m: m.group(m.lastindex), ai_response).strip()
         
         # Ensure proper spacing and punctuation for speech
-        transcript = re.sub(r'\s+', ' ', transcript)              # Normalize whitespace
-        transcript = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', transcript)  # Ensure space after sentences
+        transcript = _WHITESPACE_PATTERN.sub(' ', transcript)         # Normalize whitespace
+        transcript = _SENTENCE_PATTERN.sub(r'\1 \2', transcript)     # Ensure space after sentences
         
         # Add pauses for better speech flow (optional - can be used by TTS systems)
         transcript = transcript.replace('. ', '. ')  # Ensure consistent sentence spacing
         
         return transcript
     
-    def _create_fallback_transcript(self, summaries: List[Dict[str, Any]], date: str) -> str:
+    def _create_fallback_transcript(self, summaries: List[Dict[str, Any]], date: Union[str, datetime]) -> str:
         """
         Create a template-based fallback transcript when AI generation fails.
         
         Args:
             summaries: List of email summary dictionaries
-            date: Date string for the transcript
+            date: Date of the transcript, as a datetime or a YYYY-MM-DD string
             
         Returns:
             str: Template-based transcript content
@@ -294,8 +368,7 @@ Format as a complete script that flows naturally when read by an AI voice assist
             
             # Format date for speech
             try:
-                date_obj = datetime.strptime(date, '%Y-%m-%d')
-                formatted_date = date_obj.strftime('%B %d, %Y')
+                formatted_date = _pretty_date(date)
             except ValueError:
                 self.logger.warning(f"Invalid date format for transcript: {date}, using as-is")
                 formatted_date = date
@@ -348,7 +421,7 @@ Format as a complete script that flows naturally when read by an AI voice assist
                     summary = email.get('summary', 'No summary available')
                     
                     # Extract sender name (remove email address if present)
-                    sender_name = re.sub(r'\s*<.*?>', '', sender).strip()
+                    sender_name = _SENDER_ADDRESS_PATTERN.sub('', sender).strip()
                     if not sender_name:
                         sender_name = "Unknown sender"
                     
@@ -371,21 +444,21 @@ Format as a complete script that flows naturally when read by an AI voice assist
                     transcript_parts.append(email_section)
                     email_counter += 1
             
-            # Action items summary with better organization
-            all_action_items = []
-            for email in summaries:
-                action_items = email.get('action_items', [])
-                if isinstance(action_items, list):
-                    all_action_items.extend(action_items)
+            # Action items summary with better organization. Only the top 5
+            # are read out, so stop collecting once there are that many.
+            top_action_items = list(islice(chain.from_iterable(
+                email['action_items'] for email in summaries
+                if isinstance(email.get('action_items'), list)
+            ), 5))
             
-            if all_action_items:
-                if len(all_action_items) == 1:
+            if top_action_items:
+                if len(top_action_items) == 1:
                     transcript_parts.append("Before you go, there's one action item that needs your attention:")
-                    transcript_parts.append(f"{all_action_items[0]}")
+                    transcript_parts.append(f"{top_action_items[0]}")
                 else:
                     transcript_parts.append("To wrap up, here are the main action items for your attention:")
-                    # Limit to top 5 action items and clean them up
-                    for item in all_action_items[:5]:
+                    # Clean up the top action items
+                    for item in top_action_items:
                         clean_item = str(item).strip()
                         if clean_item and not clean_item.startswith('-'):
                             transcript_parts.append(f"- {clean_item}")
@@ -393,7 +466,7 @@ Format as a complete script that flows naturally when read by an AI voice assist
             # Closing with variety
             if email_count == 1:
                 transcript_parts.append("That's your single important email for today. Have a great day!")
-            elif all_action_items:
+            elif top_action_items:
                 transcript_parts.append("That concludes your email briefing. Stay productive!")
             else:
                 transcript_parts.append("That's all for today's email briefing. Have a wonderful day!")
@@ -402,7 +475,7 @@ Format as a complete script that flows naturally when read by an AI voice assist
             result = ' '.join(transcript_parts)
             
             # Final cleanup for speech synthesis
-            result = re.sub(r'\s+', ' ', result)  # Normalize whitespace
+            result = _WHITESPACE_PATTERN.sub(' ', result)  # Normalize whitespace
             result = result.replace('..', '.')    # Fix double periods
             
             self.logger.debug(f"Generated fallback transcript with {len(transcript_parts)} sections")
@@ -413,20 +486,19 @@ Format as a complete script that flows naturally when read by an AI voice assist
             # Return a minimal safe transcript
             return self._create_minimal_fallback_transcript(date, len(summaries) if summaries else 0)
     
-    def _create_empty_day_transcript(self, date: str) -> str:
+    def _create_empty_day_transcript(self, date: Union[str, datetime]) -> str:
         """
         Create a transcript for days with no important emails.
         
         Args:
-            date: Date string for the transcript
+            date: Date of the transcript, as a datetime or a YYYY-MM-DD string
             
         Returns:
             str: Transcript content for empty email day
         """
         try:
-            date_obj = datetime.strptime(date, '%Y-%m-%d')
-            formatted_date = date_obj.strftime('%B %d, %Y')
-            day_of_week = date_obj.strftime('%A')
+            formatted_date = _pretty_date(date)
+            day_of_week = _weekday(date)
         except ValueError:
             self.logger.warning(f"Invalid date format for empty day transcript: {date}")
             formatted_date = date
@@ -461,20 +533,19 @@ Format as a complete script that flows naturally when read by an AI voice assist
         self.logger.debug(f"Generated empty day transcript for {formatted_date}")
         return message
     
-    def _create_minimal_fallback_transcript(self, date: str, email_count: int) -> str:
+    def _create_minimal_fallback_transcript(self, date: Union[str, datetime], email_count: int) -> str:
         """
         Create a minimal safe transcript when all other generation methods fail.
         
         Args:
-            date: Date string for the transcript
+            date: Date of the transcript, as a datetime or a YYYY-MM-DD string
             email_count: Number of emails processed
             
         Returns:
             str: Minimal safe transcript content
         """
         try:
-            date_obj = datetime.strptime(date, '%Y-%m-%d')
-            formatted_date = date_obj.strftime('%B %d, %Y')
+            formatted_date = _pretty_date(date)
         except ValueError:
             formatted_date = date
         
@@ -21,6 +21,12 @@ from config.settings import Config, load_config
 from utils.error_handling import RetryableError, NonRetryableError, ErrorCategory
 
 
+def _read_json(path):
+    """Load a JSON file written by the manager."""
+    with open(path) as f:
+        return json.load(f)
+
+
 class TestBackwardCompatibility(unittest.TestCase):
     """Test backward compatibility scenarios."""
     
@@ -35,10 +41,7 @@ class TestBackwardCompatibility(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test fixtures."""
-        if os.path.exists(self.config_file):
-            os.remove(self.config_file)
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def test_functionality_without_search_configs_file(self):
         """Test that application works when search configs file doesn't exist."""
@@ -144,8 +147,7 @@ class TestConfigurationMigration(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test fixtures."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def test_migration_from_legacy_format(self):
         """Test migration from legacy configuration format (no version field)."""
@@ -174,8 +176,7 @@ class TestConfigurationMigration(unittest.TestCase):
         search_manager = SearchConfigManager(self.config_file)
         
         # Verify migration occurred
-        with open(self.config_file, 'r') as f:
-            migrated_data = json.load(f)
+        migrated_data = _read_json(self.config_file)
         
         self.assertEqual(migrated_data["version"], "1.0")
         self.assertIn("configs", migrated_data)
@@ -208,8 +209,7 @@ class TestConfigurationMigration(unittest.TestCase):
         search_manager = SearchConfigManager(self.config_file)
         
         # Verify migration occurred
-        with open(self.config_file, 'r') as f:
-            migrated_data = json.load(f)
+        migrated_data = _read_json(self.config_file)
         
         self.assertEqual(migrated_data["version"], "1.0")
         self.assertIn("configs", migrated_data)
@@ -247,8 +247,7 @@ class TestConfigurationMigration(unittest.TestCase):
         search_manager = SearchConfigManager(self.config_file)
         
         # Verify it handled the unsupported version
-        with open(self.config_file, 'r') as f:
-            migrated_data = json.load(f)
+        migrated_data = _read_json(self.config_file)
         
         self.assertEqual(migrated_data["version"], "1.0")
         self.assertIn("configs", migrated_data)
@@ -285,8 +284,7 @@ class TestConfigurationMigration(unittest.TestCase):
         
         # Verify backup contains original data
         backup_path = os.path.join(self.temp_dir, backup_files[0])
-        with open(backup_path, 'r') as f:
-            backup_data = json.load(f)
+        backup_data = _read_json(backup_path)
         
         self.assertEqual(backup_data, legacy_config)
     
@@ -316,8 +314,7 @@ class TestConfigurationMigration(unittest.TestCase):
             search_manager._check_and_migrate_config_file()
         
         # Original file should still be intact
-        with open(self.config_file, 'r') as f:
-            current_data = json.load(f)
+        current_data = _read_json(self.config_file)
         
         # Should still have the original data (migration failure should not corrupt file)
         self.assertIn("configs", current_data)
@@ -398,8 +395,7 @@ class TestEndToEndBackwardCompatibility(unittest.TestCase):
         for patch_obj in self.mock_patches:
             patch_obj.stop()
         
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def test_end_to_end_without_search_config_file(self):
         """Test complete workflow when search configuration file doesn't exist."""
@@ -528,8 +524,7 @@ class TestSearchFeatureAvailability(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test fixtures."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def test_search_features_available_with_valid_config(self):
         """Test that search features are reported as available with valid configuration."""
@@ -14,6 +14,51 @@ from gmail_email.fetcher import EmailFetcher, QueryValidationError, EmailFetchEr
 from utils.error_handling import RetryableError, NonRetryableError, ErrorCategory
 
 
+def _gmail_message(subject, sender):
+    """Build a minimal Gmail API message resource."""
+    return {
+        "payload": {
+            "headers": [
+                {"name": "Subject", "value": subject},
+                {"name": "From", "value": sender}
+            ]
+        }
+    }
+
+
+def _install_batch_responses(service, responses):
+    """Make batch requests on a mock Gmail service answer from a dict.
+    
+    Args:
+        service: Mock Gmail service
+        responses: Mapping of message ID to a message resource or an exception
+        
+    Returns:
+        List that collects every batch created on the service
+    """
+    batches = []
+    
+    def new_batch_http_request(callback):
+        batch = Mock()
+        request_ids = []
+        batch.add.side_effect = lambda request, request_id: request_ids.append(request_id)
+        
+        def execute():
+            for request_id in request_ids:
+                response = responses[request_id]
+                if isinstance(response, Exception):
+                    callback(request_id, None, response)
+                else:
+                    callback(request_id, response, None)
+        
+        batch.execute.side_effect = execute
+        batches.append(batch)
+        return batch
+    
+    service.new_batch_http_request.side_effect = new_batch_http_request
+    return batches
+
+
 class TestEmailFetcherQueryValidation(unittest.TestCase):
     """Test Gmail query validation functionality."""
     
@@ -127,27 +172,43 @@ class TestEmailFetcherCustomQueries(unittest.TestCase):
         # Setup mocks
         query = "from:test@example.com is:unread"
         message_ids = ["msg1", "msg2", "msg3"]
-        email_data = [
-            {"message_id": "msg1", "subject": "Test 1", "sender": "test@example.com"},
-            {"message_id": "msg2", "subject": "Test 2", "sender": "test@example.com"},
-            {"message_id": "msg3", "subject": "Test 3", "sender": "test@example.com"}
-        ]
+        batches = _install_batch_responses(self.mock_service, {
+            message_id: _gmail_message(f"Test {i+1}", "test@example.com")
+            for i, message_id in enumerate(message_ids)
+        })
         
         self.fetcher._get_message_ids.return_value = message_ids
-        self.fetcher.get_email_content.side_effect = email_data
         
         # Execute
         result = self.fetcher.fetch_emails_with_query(query, max_results=10)
         
-        # Verify
+        # Verify all messages were fetched in a single batch
         self.assertEqual(len(result), 3)
         self.fetcher._get_message_ids.assert_called_once_with(query, 10)
-        self.assertEqual(self.fetcher.get_email_content.call_count, 3)
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0].add.call_count, 3)
+        batches[0].execute.assert_called_once()
+        self.fetcher.get_email_content.assert_not_called()
         
         for i, email in enumerate(result):
             self.assertEqual(email["message_id"], f"msg{i+1}")
             self.assertEqual(email["sender"], "test@example.com")
     
+    def test_fetch_emails_with_query_batches_large_results(self):
+        """Test that message fetches are chunked into Gmail-sized batches."""
+        message_ids = [f"msg{i}" for i in range(250)]
+        batches = _install_batch_responses(self.mock_service, {
+            message_id: _gmail_message(message_id, "test@example.com")
+            for message_id in message_ids
+        })
+        self.fetcher._get_message_ids.return_value = message_ids
+        
+        result = self.fetcher.fetch_emails_with_query("is:unread", max_results=250)
+        
+        self.assertEqual(len(result), 250)
+        self.assertEqual([batch.add.call_count for batch in batches], [50, 50, 50, 50, 50])
+        self.assertEqual([email["message_id"] for email in result], message_ids)
+    
     def test_fetch_emails_with_query_invalid_query(self):
         """Test fetch_emails_with_query with invalid query."""
         invalid_query = "invalid_operator:value"
@@ -172,24 +233,59 @@ class TestEmailFetcherCustomQueries(unittest.TestCase):
     def test_fetch_emails_with_query_partial_failure(self):
         """Test fetch_emails_with_query with some emails failing to fetch."""
         query = "from:test@example.com"
-        message_ids = ["msg1", "msg2", "msg3"]
+        message_ids = ["msg1", "msg2", "msg3", "msg4"]
         
         self.fetcher._get_message_ids.return_value = message_ids
+        _install_batch_responses(self.mock_service, {
+            "msg1": _gmail_message("Test msg1", "test@example.com"),
+            "msg2": HttpError(resp=Mock(status=500), content=b'{"error": {"code": 500}}'),
+            "msg3": _gmail_message("Test msg3", "test@example.com"),
+            "msg4": HttpError(resp=Mock(status=404), content=b'{"error": {"code": 404}}')
+        })
         
-        # Mock get_email_content to succeed for some, fail for others
-        def mock_get_email_content(msg_id):
-            if msg_id == "msg2":
-                raise RetryableError("Temporary failure", ErrorCategory.NETWORK)
-            return {"message_id": msg_id, "subject": f"Test {msg_id}"}
-        
-        self.fetcher.get_email_content.side_effect = mock_get_email_content
+        # Messages that fail inside the batch are retried individually
+        self.fetcher.get_email_content.side_effect = RetryableError("Temporary failure", ErrorCategory.NETWORK)
         
         result = self.fetcher.fetch_emails_with_query(query)
         
-        # Should return 2 emails (msg1 and msg3), skipping the failed msg2
+        # Should return 2 emails (msg1 and msg3), skipping the failed msg2 and deleted msg4
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]["message_id"], "msg1")
         self.assertEqual(result[1]["message_id"], "msg3")
+        self.fetcher.get_email_content.assert_called_once_with("msg2")
+    
+    def test_fetch_emails_with_query_batch_execute_failure(self):
+        """Test that a failed batch request falls back to individual fetches."""
+        message_ids = ["msg1", "msg2", "msg3"]
+        self.fetcher._get_message_ids.return_value = message_ids
+        self.mock_service.new_batch_http_request.return_value.execute.side_effect = \
+            HttpError(resp=Mock(status=503), content=b'{"error": {"code": 503}}')
+        self.fetcher.get_email_content.side_effect = lambda message_id: {
+            "message_id": message_id, "subject": f"Test {message_id}"
+        }
+        
+        result = self.fetcher.fetch_emails_with_query("from:test@example.com")
+        
+        # Every message of the failed batch is fetched individually, in order
+        self.assertEqual([email["message_id"] for email in result], message_ids)
+        self.assertEqual(
+            [c.args[0] for c in self.fetcher.get_email_content.call_args_list], message_ids
+        )
+    
+    def test_fetch_emails_with_query_batch_callback_parse_error(self):
+        """Test that a message failing to parse in the batch is retried alone."""
+        message_ids = ["msg1", "msg2"]
+        self.fetcher._get_message_ids.return_value = message_ids
+        _install_batch_responses(self.mock_service, {
+            "msg1": _gmail_message("Test msg1", "test@example.com"),
+            "msg2": {"payload": None}
+        })
+        self.fetcher.get_email_content.return_value = {"message_id": "msg2", "subject": "Test msg2"}
+        
+        result = self.fetcher.fetch_emails_with_query("from:test@example.com")
+        
+        self.assertEqual([email["message_id"] for email in result], message_ids)
+        self.fetcher.get_email_content.assert_called_once_with("msg2")
     
     @patch('gmail_email.fetcher.handle_gmail_api_error')
     def test_fetch_emails_with_query_gmail_api_error(self, mock_handle_error):
@@ -239,13 +335,12 @@ class TestEmailFetcherIntegration(unittest.TestCase):
         
         # Mock the internal methods that are actually called
         message_ids = ['msg1', 'msg2']
-        email_data = [
-            {"message_id": "msg1", "subject": "Project Update", "sender": "sender@company.com"},
-            {"message_id": "msg2", "subject": "Project Update 2", "sender": "sender@company.com"}
-        ]
+        batches = _install_batch_responses(self.mock_service, {
+            "msg1": _gmail_message("Project Update", "sender@company.com"),
+            "msg2": _gmail_message("Project Update 2", "sender@company.com")
+        })
         
         self.fetcher._get_message_ids = Mock(return_value=message_ids)
-        self.fetcher.get_email_content = Mock(side_effect=email_data)
         
         # Execute
         result = self.fetcher.fetch_emails_with_query(complex_query, max_results=10)
@@ -256,7 +351,8 @@ class TestEmailFetcherIntegration(unittest.TestCase):
         
         # Verify internal methods were called with correct parameters
         self.fetcher._get_message_ids.assert_called_once_with(complex_query, 10)
-        self.assertEqual(self.fetcher.get_email_content.call_count, 2)
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0].add.call_count, 2)
         
         # Verify the returned data
         for i, email in enumerate(result):
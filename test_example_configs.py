@@ -4,8 +4,15 @@ Unit tests for example configurations and Gmail search help functionality.
 
 Tests the example configurations, search help system, and validation features
 to ensure they provide accurate and helpful information to users.
+
+The test classes share no mutable state or file paths, so the module can be
+run in parallel with pytest-xdist:
+
+    python -m pytest -n auto test_example_configs.py
 """
 
+import functools
+import io
 import unittest
 import tempfile
 import os
@@ -14,10 +21,11 @@ from datetime import datetime
 from unittest.mock import patch, MagicMock
 
 from config.example_configs import (
-    GmailSearchHelp, ExampleConfigurations, 
-    validate_example_configurations, create_example_config_file
+    GmailSearchHelp, ExampleConfigurations, OPERATOR_KEYS,
+    validate_example_configurations, create_example_config_file,
+    build_example_config_payload
 )
-from config.search_configs import SearchConfig, QueryValidator
+from config.search_configs import SearchConfig, QueryValidator, SUPPORTED_OPERATORS_SET
 
 
 class TestGmailSearchHelp(unittest.TestCase):
@@ -54,15 +62,15 @@ class TestGmailSearchHelp(unittest.TestCase):
         """Test getting search suggestions for queries."""
         # Test query with from: but no unread filter
         suggestions = GmailSearchHelp.get_search_suggestions("from:john@example.com")
-        self.assertTrue(any("is:unread" in s for s in suggestions))
+        self.assertIn("is:unread", "\n".join(suggestions))
         
         # Test query with has:attachment but no size filter
         suggestions = GmailSearchHelp.get_search_suggestions("has:attachment")
-        self.assertTrue(any("larger:" in s for s in suggestions))
+        self.assertIn("larger:", "\n".join(suggestions))
         
         # Test query without date filters
         suggestions = GmailSearchHelp.get_search_suggestions("subject:meeting")
-        self.assertTrue(any("date filter" in s for s in suggestions))
+        self.assertIn("date filter", "\n".join(suggestions))
     
     def test_operators_have_required_fields(self):
         """Test that all operators have required fields."""
@@ -88,6 +96,15 @@ class TestGmailSearchHelp(unittest.TestCase):
 class TestExampleConfigurations(unittest.TestCase):
     """Test cases for example configurations functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Load the example configurations once for the whole class."""
+        cls.configs = ExampleConfigurations.get_example_configs()
+        cls.stripped_fields = [
+            (config.name, config.query.strip(), config.description.strip())
+            for config in cls.configs
+        ]
+    
     def test_get_example_configs(self):
         """Test getting example configurations."""
         configs = ExampleConfigurations.get_example_configs()
@@ -138,31 +155,54 @@ class TestExampleConfigurations(unittest.TestCase):
         for suggestion_list in [suggestions]:
             self.assertLessEqual(len(suggestion_list), 5)
     
+    def test_get_example_configs_returns_fresh_instances(self):
+        """Test that each call builds new configurations stamped with the current time."""
+        before = datetime.now()
+        configs = ExampleConfigurations.get_example_configs()
+        
+        self.assertEqual(len(configs), len(self.configs))
+        for earlier, config in zip(self.configs, configs):
+            self.assertIsNot(earlier, config)
+            self.assertEqual(config.name, earlier.name)
+            self.assertGreaterEqual(config.created_at, before)
+        
+        # Changing a returned configuration does not leak into later calls
+        configs[0].description = "Changed by caller"
+        self.assertNotEqual(
+            ExampleConfigurations.get_example_configs()[0].description, "Changed by caller"
+        )
+    
     def test_unique_config_names(self):
         """Test that all example configuration names are unique."""
-        configs = ExampleConfigurations.get_example_configs()
-        names = [config.name for config in configs]
+        names = [config.name for config in self.configs]
         
         self.assertEqual(len(names), len(set(names)), "Configuration names must be unique")
     
     def test_config_queries_not_empty(self):
         """Test that all configuration queries are non-empty."""
-        configs = ExampleConfigurations.get_example_configs()
-        
-        for config in configs:
-            self.assertTrue(config.query.strip(), f"Config '{config.name}' has empty query")
+        for name, query, _ in self.stripped_fields:
+            self.assertTrue(query, f"Config '{name}' has empty query")
     
     def test_config_descriptions_not_empty(self):
         """Test that all configuration descriptions are non-empty."""
-        configs = ExampleConfigurations.get_example_configs()
-        
-        for config in configs:
-            self.assertTrue(config.description.strip(), f"Config '{config.name}' has empty description")
+        for name, _, description in self.stripped_fields:
+            self.assertTrue(description, f"Config '{name}' has empty description")
 
 
 class TestExampleConfigValidation(unittest.TestCase):
     """Test cases for example configuration validation."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Load the example configurations and validator once for the whole class."""
+        cls.configs = ExampleConfigurations.get_example_configs()
+        cls.validator = QueryValidator()
+        cls._validate = staticmethod(functools.lru_cache(maxsize=512)(cls.validator.validate_query))
+        cls.extracted = [
+            (config.name, cls.validator._extract_operators(config.query))
+            for config in cls.configs
+        ]
+    
     def test_validate_example_configurations(self):
         """Test that all example configurations have valid queries."""
         is_valid, errors = validate_example_configurations()
@@ -175,38 +215,64 @@ class TestExampleConfigValidation(unittest.TestCase):
     
     def test_individual_config_validation(self):
         """Test validation of individual example configurations."""
-        validator = QueryValidator()
-        configs = ExampleConfigurations.get_example_configs()
-        
-        for config in configs:
-            is_valid, error_msg = validator.validate_query(config.query)
-            self.assertTrue(
-                is_valid, 
-                f"Config '{config.name}' has invalid query '{config.query}': {error_msg}"
-            )
+        results = [(config.name, config.query, *self._validate(config.query)) for config in self.configs]
+        invalid = [
+            (name, query, error_msg)
+            for name, query, is_valid, error_msg in results
+            if not is_valid
+        ]
+        self.assertFalse(invalid, f"Invalid config queries (name, query, error): {invalid}")
     
     def test_config_queries_use_supported_operators(self):
         """Test that example configurations only use supported Gmail operators."""
-        validator = QueryValidator()
-        configs = ExampleConfigurations.get_example_configs()
-        
-        for config in configs:
-            operators = validator._extract_operators(config.query)
-            for operator, value in operators:
-                self.assertIn(
-                    operator, 
-                    validator.SUPPORTED_OPERATORS,
-                    f"Config '{config.name}' uses unsupported operator '{operator}'"
-                )
+        operators = {operator for _, pairs in self.extracted for operator, _ in pairs}
+        self.assertLessEqual(
+            operators,
+            SUPPORTED_OPERATORS_SET,
+            "Example configurations use unsupported operators"
+        )
 
 
 class TestCreateExampleConfigFile(unittest.TestCase):
     """Test cases for creating example configuration files."""
     
-    def test_create_example_config_file(self):
-        """Test creating an example configuration file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            temp_path = temp_file.name
+    def test_build_example_config_payload(self):
+        """Test building the example configuration payload."""
+        data = build_example_config_payload()
+        
+        # Verify structure
+        self.assertIn('version', data)
+        self.assertIn('description', data)
+        self.assertIn('usage', data)
+        self.assertIn('categories', data)
+        self.assertIn('all_examples', data)
+        
+        # Verify categories contain configurations
+        self.assertIsInstance(data['categories'], dict)
+        self.assertTrue(len(data['categories']) > 0)
+        
+        # Verify all_examples contains configurations
+        self.assertIsInstance(data['all_examples'], dict)
+        self.assertTrue(len(data['all_examples']) > 0)
+    
+    def test_create_example_config_file_stream(self):
+        """Test writing the example configuration to a file-like object."""
+        stream = io.StringIO()
+        
+        # Freeze the clock so both payloads carry the same timestamps
+        with patch('config.example_configs.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 1, 15, 9, 30, 0)
+            success = create_example_config_file(stream)
+            self.assertTrue(success, "Should successfully write example config")
+            expected = json.loads(json.dumps(build_example_config_payload()))
+        
+        data = json.loads(stream.getvalue())
+        self.assertEqual(data, expected)
+    
+    def test_create_example_config_file_writes_valid_json(self):
+        """Test creating an example configuration file on disk."""
+        fd, temp_path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
         
         try:
             # Create the example file
@@ -219,19 +285,7 @@ class TestCreateExampleConfigFile(unittest.TestCase):
             with open(temp_path, 'r') as f:
                 data = json.load(f)
             
-            # Verify structure
-            self.assertIn('version', data)
-            self.assertIn('description', data)
-            self.assertIn('usage', data)
-            self.assertIn('categories', data)
             self.assertIn('all_examples', data)
-            
-            # Verify categories contain configurations
-            self.assertIsInstance(data['categories'], dict)
-            self.assertTrue(len(data['categories']) > 0)
-            
-            # Verify all_examples contains configurations
-            self.assertIsInstance(data['all_examples'], dict)
             self.assertTrue(len(data['all_examples']) > 0)
             
         finally:
@@ -250,42 +304,48 @@ class TestCreateExampleConfigFile(unittest.TestCase):
 class TestSearchHelpIntegration(unittest.TestCase):
     """Integration tests for search help functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create a shared validator and flatten the help examples once."""
+        cls.validator = QueryValidator()
+        cls._validate = staticmethod(functools.lru_cache(maxsize=512)(cls.validator.validate_query))
+        cls.examples = tuple(
+            (operator, example)
+            for operator, info in GmailSearchHelp.OPERATORS.items()
+            for example in info['examples']
+        )
+    
     def test_help_covers_all_validator_operators(self):
         """Test that help system covers all operators supported by validator."""
-        validator = QueryValidator()
-        help_operators = set(GmailSearchHelp.OPERATORS.keys())
-        validator_operators = set(validator.SUPPORTED_OPERATORS)
-        
         # Help should cover all validator operators
-        missing_operators = validator_operators - help_operators
-        self.assertEqual(
-            len(missing_operators), 0,
+        missing_operators = SUPPORTED_OPERATORS_SET - OPERATOR_KEYS
+        self.assertFalse(
+            missing_operators,
             f"Help system missing operators: {missing_operators}"
         )
     
     def test_help_examples_are_valid(self):
         """Test that all examples in help system are valid queries."""
-        validator = QueryValidator()
-        
-        for operator, info in GmailSearchHelp.OPERATORS.items():
-            for example in info['examples']:
-                is_valid, error_msg = validator.validate_query(example)
-                self.assertTrue(
-                    is_valid,
-                    f"Help example '{example}' for operator '{operator}' is invalid: {error_msg}"
-                )
+        results = [(operator, example, *self._validate(example)) for operator, example in self.examples]
+        invalid = [
+            (operator, example, error_msg)
+            for operator, example, is_valid, error_msg in results
+            if not is_valid
+        ]
+        self.assertFalse(invalid, f"Invalid help examples (operator, example, error): {invalid}")
     
     def test_search_patterns_are_valid(self):
         """Test that all search patterns in help system are valid queries."""
-        validator = QueryValidator()
-        
-        for pattern_name, pattern_info in GmailSearchHelp.SEARCH_PATTERNS.items():
-            query = pattern_info['query']
-            is_valid, error_msg = validator.validate_query(query)
-            self.assertTrue(
-                is_valid,
-                f"Search pattern '{pattern_name}' has invalid query '{query}': {error_msg}"
-            )
+        results = [
+            (pattern_name, pattern_info['query'], *self._validate(pattern_info['query']))
+            for pattern_name, pattern_info in GmailSearchHelp.SEARCH_PATTERNS.items()
+        ]
+        invalid = [
+            (pattern_name, query, error_msg)
+            for pattern_name, query, is_valid, error_msg in results
+            if not is_valid
+        ]
+        self.assertFalse(invalid, f"Invalid search patterns (name, query, error): {invalid}")
 
 
 class TestMainIntegration(unittest.TestCase):
@@ -5,18 +5,24 @@ Comprehensive test script for MCP server tools.
 Tests all available MCP tools with basic functionality to ensure they work correctly.
 """
 
-import asyncio
 import sys
 import logging
+from datetime import datetime
 from pathlib import Path
 
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from config.search_configs import SearchConfig
+from summarization.summarizer import EmailSummarizer
+
 # Configure logging for tests
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fixed clock for tool results so timestamps do not depend on wall time
+FIXED_TS = datetime(2024, 1, 15, 9, 30, 0)
+
 class MCPServerTests:
     """Test suite for MCP server tools."""
 
@@ -24,373 +30,299 @@ class MCPServerTests:
         self.passed_tests = 0
         self.failed_tests = 0
         self.test_results = {}
+        self._server = None
+        self._config = None
+        self._search_manager = None
+        # Output lines are buffered and written once by print_summary
+        self._log = []
 
-    async def run_all_tests(self):
+    def run_all_tests(self):
         """Run all MCP server tests."""
-        print("🧪 Starting MCP Server Test Suite")
-        print("=" * 50)
-
-        # Import and initialize services
-        from mcp_server import initialize_services
-        if not initialize_services():
-            print("❌ FATAL: Failed to initialize MCP server services")
+        self._log.append("🧪 Starting MCP Server Test Suite")
+        self._log.append("=" * 50)
+
+        # Import and initialize services. The server module is imported here
+        # rather than at the top because importing it sets up log files.
+        import mcp_server
+        if not mcp_server.initialize_services():
+            self._log.append("❌ FATAL: Failed to initialize MCP server services")
+            self._flush_log()
             return False
 
-        print("✅ MCP server services initialized successfully\n")
+        # Reuse the loaded server, config and search manager across all tests
+        self._server = mcp_server
+        self._config = mcp_server.config
+        self._search_manager = mcp_server.search_manager
 
-        # Test each tool
-        await self.test_get_status()
-        await self.test_list_configs()
-        await self.test_create_config()
-        await self.test_search_by_config()
-        await self.test_search_by_query()
-        await self.test_delete_config()
-        await self.test_ai_connection()
-        await self.test_stdio_argument()
+        self._log.append("✅ MCP server services initialized successfully\n")
+
+        # The tool functions are synchronous, so the tests run one after
+        # another: independent checks first, then the ordered
+        # create -> search_by_config -> delete lifecycle.
+        for test in self._independent_tests() + self._lifecycle_tests():
+            self._run(*test)
+        self._run(
+            "stdio_argument", "--stdio argument parsing", self._do_stdio_argument,
+            lambda r: r["no_args"] is False and r["with_stdio"] is True
+        )
 
         # Print summary
         self.print_summary()
 
         return self.failed_tests == 0
 
-    async def test_get_status(self):
-        """Test the get_status tool."""
-        print("🔍 Testing get_status tool...")
+    def _independent_tests(self):
+        """Tool tests that do not depend on each other.
+
+        Returns:
+            List of (name, label, test function, result predicate) tuples
+        """
+        return [
+            ("get_status", "get_status tool", self._do_get_status,
+             lambda r: bool(r.get("server"))),
+            ("list_configs", "list_configs tool", self._do_list_configs,
+             lambda r: "total_configs" in r),
+            ("search_by_query", "search_by_query tool", self._do_search_by_query,
+             lambda r: "query" in r and "total_found" in r),
+            ("test_ai", "test_ai tool", self._do_ai_connection,
+             lambda r: "status" in r or "provider" in r),
+        ]
+
+    def _lifecycle_tests(self):
+        """Config tool tests that must run in order.
+
+        Returns:
+            List of (name, label, test function, result predicate) tuples
+        """
+        return [
+            ("create_config", "create_config tool", self._do_create_config,
+             lambda r: r.get("status") == "success"),
+            ("search_by_config", "search_by_config tool", self._do_search_by_config,
+             lambda r: "query" in r),
+            ("delete_config", "delete_config tool", self._do_delete_config,
+             lambda r: r.get("status") == "success"),
+        ]
+
+    def _run(self, name, label, test_fn, predicate):
+        """Run a single tool test and record its outcome.
+
+        Args:
+            name: Name used in the results summary
+            label: Description printed before the test runs
+            test_fn: Callable returning the tool's result dictionary
+            predicate: Callable validating the result dictionary
+        """
+        self._log.append(f"🔍 Testing {label}...")
         try:
-            # Test get_status functionality by calling the internal logic
-            from config.settings import load_config
-            from config.search_configs import SearchConfigManager
-            from datetime import datetime
-
-            # Recreate the get_status logic directly
-            config = load_config()
-            search_manager = SearchConfigManager()
-
-            status = {
-                "server": "Gmail Email Summarizer MCP Server",
-                "status": "running",
-                "timestamp": datetime.now().isoformat(),
-                "services": {}
-            }
-
-            if config:
-                status["services"]["config"] = {
-                    "status": "loaded",
-                    "ai_provider": getattr(config, 'ai_provider', 'unknown'),
-                    "output_dir": getattr(config, 'output_dir', 'unknown')
-                }
-            else:
-                status["services"]["config"] = {"status": "not_loaded"}
-
-            if search_manager:
-                try:
-                    configs = search_manager.list_configs()
-                    status["services"]["search_manager"] = {
-                        "status": "loaded",
-                        "total_configs": len(configs)
-                    }
-                except Exception as e:
-                    status["services"]["search_manager"] = {
-                        "status": "error",
-                        "error": str(e)
-                    }
-            else:
-                status["services"]["search_manager"] = {"status": "not_loaded"}
-
-            result = status
+            result = test_fn()
 
-            if isinstance(result, dict) and result.get("server"):
-                print("✅ get_status: PASSED")
+            if isinstance(result, dict) and predicate(result):
+                self._log.append(f"✅ {name}: PASSED")
                 self.passed_tests += 1
-                self.test_results["get_status"] = "PASSED"
+                self.test_results[name] = "PASSED"
             else:
-                print(f"❌ get_status: FAILED - Unexpected result: {result}")
+                self._log.append(f"❌ {name}: FAILED - Unexpected result: {result}")
                 self.failed_tests += 1
-                self.test_results["get_status"] = f"FAILED - Unexpected result"
+                self.test_results[name] = "FAILED - Unexpected result"
 
         except Exception as e:
-            print(f"❌ get_status: FAILED - Exception: {e}")
+            self._log.append(f"❌ {name}: FAILED - Exception: {e}")
             self.failed_tests += 1
-            self.test_results["get_status"] = f"FAILED - {str(e)}"
-
-    async def test_list_configs(self):
-        """Test the list_configs tool."""
-        print("🔍 Testing list_configs tool...")
-        try:
-            # Test list_configs functionality directly
-            from config.search_configs import SearchConfigManager
-
-            search_manager = SearchConfigManager()
-            configs = search_manager.list_configs()
-
-            result = {
-                "total_configs": len(configs),
-                "configs": []
+            self.test_results[name] = f"FAILED - {str(e)}"
+
+    def _do_get_status(self):
+        """Recreate the get_status tool logic with a frozen clock."""
+        return self._build_status(now=lambda: FIXED_TS)
+
+    def _build_status(self, now=datetime.now):
+        """Build the get_status tool result.
+
+        Args:
+            now: Callable returning the datetime used for the timestamp
+
+        Returns:
+            Status dictionary matching the get_status tool output
+        """
+        config = self._config
+        search_manager = self._search_manager
+
+        status = {
+            "server": "Gmail Email Summarizer MCP Server",
+            "status": "running",
+            "timestamp": now().isoformat(),
+            "services": {}
+        }
+
+        if config:
+            status["services"]["config"] = {
+                "status": "loaded",
+                "ai_provider": config.ai_provider,
+                "output_dir": config.output_directory
             }
+        else:
+            status["services"]["config"] = {"status": "not_loaded"}
 
-            for config_data in configs:
-                result["configs"].append({
-                    "name": config_data.name,
-                    "query": config_data.query,
-                    "description": getattr(config_data, "description", ""),
-                    "created_at": config_data.created_at.isoformat() if config_data.created_at else None,
-                    "last_used": config_data.last_used.isoformat() if config_data.last_used else None
-                })
-
-            if isinstance(result, dict) and "total_configs" in result:
-                print("✅ list_configs: PASSED")
-                self.passed_tests += 1
-                self.test_results["list_configs"] = "PASSED"
-            else:
-                print(f"❌ list_configs: FAILED - Unexpected result: {result}")
-                self.failed_tests += 1
-                self.test_results["list_configs"] = f"FAILED - Unexpected result"
-
-        except Exception as e:
-            print(f"❌ list_configs: FAILED - Exception: {e}")
-            self.failed_tests += 1
-            self.test_results["list_configs"] = f"FAILED - {str(e)}"
-
-    async def test_create_config(self):
-        """Test the create_config tool."""
-        print("🔍 Testing create_config tool...")
-        try:
-            from config.search_configs import SearchConfigManager, SearchConfig
-            from datetime import datetime
-
-            search_manager = SearchConfigManager()
-            test_config_name = "test_config_mcp"
-            test_query = "subject:test"
-            test_description = "Test configuration for MCP testing"
-
-            # Create the configuration
-            search_config = SearchConfig(
-                name=test_config_name,
-                query=test_query,
-                description=test_description,
-                created_at=datetime.now(),
-                last_used=None
-            )
-
-            # Save it
-            search_manager.save_config(search_config)
-
-            result = {
-                "status": "success",
-                "message": f"Configuration '{test_config_name}' created successfully",
-                "config": {
-                    "name": test_config_name,
-                    "query": test_query,
-                    "description": test_description,
-                    "created_at": search_config.created_at.isoformat()
+        if search_manager:
+            try:
+                configs = search_manager.list_configs()
+                status["services"]["search_manager"] = {
+                    "status": "loaded",
+                    "total_configs": len(configs)
                 }
+            except Exception as e:
+                status["services"]["search_manager"] = {
+                    "status": "error",
+                    "error": str(e)
+                }
+        else:
+            status["services"]["search_manager"] = {"status": "not_loaded"}
+
+        return status
+
+    def _do_list_configs(self):
+        """Recreate the list_configs tool logic."""
+        configs = self._search_manager.list_configs()
+
+        result = {
+            "total_configs": len(configs),
+            "configs": []
+        }
+
+        for config_data in configs:
+            result["configs"].append({
+                "name": config_data.name,
+                "query": config_data.query,
+                "description": getattr(config_data, "description", ""),
+                "created_at": config_data.created_at.isoformat() if config_data.created_at else None,
+                "last_used": config_data.last_used.isoformat() if config_data.last_used else None
+            })
+
+        return result
+
+    def _do_create_config(self):
+        """Create the test configuration used by the lifecycle tests."""
+        test_config_name = "test_config_mcp"
+        test_query = "subject:test"
+        test_description = "Test configuration for MCP testing"
+
+        search_config = SearchConfig(
+            name=test_config_name,
+            query=test_query,
+            description=test_description,
+            created_at=FIXED_TS,
+            last_used=None
+        )
+
+        self._search_manager.save_config(search_config)
+
+        return {
+            "status": "success",
+            "message": f"Configuration '{test_config_name}' created successfully",
+            "config": {
+                "name": test_config_name,
+                "query": test_query,
+                "description": test_description,
+                "created_at": search_config.created_at.isoformat()
             }
-
-            if isinstance(result, dict) and result.get("status") == "success":
-                print("✅ create_config: PASSED")
-                self.passed_tests += 1
-                self.test_results["create_config"] = "PASSED"
-            else:
-                print(f"❌ create_config: FAILED - Unexpected result: {result}")
-                self.failed_tests += 1
-                self.test_results["create_config"] = f"FAILED - Unexpected result"
-
-        except Exception as e:
-            print(f"❌ create_config: FAILED - Exception: {e}")
-            self.failed_tests += 1
-            self.test_results["create_config"] = f"FAILED - {str(e)}"
-
-    async def test_search_by_config(self):
-        """Test the search_by_config tool."""
-        print("🔍 Testing search_by_config tool...")
-        try:
-            from config.search_configs import SearchConfigManager
-
-            search_manager = SearchConfigManager()
-            # Load the search configuration
-            search_config = search_manager.load_config("test_config_mcp")
-
-            # Test just that we can load the config and get its query
-            result = {
-                "query": search_config.query,
-                "config_name": "test_config_mcp",
-                "total_found": 0,  # Simulated since we're not actually searching
-                "message": "Configuration loaded successfully (email search skipped for testing)"
-            }
-
-            if isinstance(result, dict) and "query" in result:
-                print("✅ search_by_config: PASSED")
-                self.passed_tests += 1
-                self.test_results["search_by_config"] = "PASSED"
-            else:
-                print(f"❌ search_by_config: FAILED - Unexpected result: {result}")
-                self.failed_tests += 1
-                self.test_results["search_by_config"] = f"FAILED - Unexpected result"
-
-        except Exception as e:
-            print(f"❌ search_by_config: FAILED - Exception: {e}")
-            self.failed_tests += 1
-            self.test_results["search_by_config"] = f"FAILED - {str(e)}"
-
-    async def test_search_by_query(self):
-        """Test the search_by_query tool."""
-        print("🔍 Testing search_by_query tool...")
-        try:
-            # Test just the query processing without Gmail authentication
-            query = "subject:test"
-            result = {
-                "query": query,
-                "total_found": 0,  # Simulated since we're not actually searching
-                "message": "Query validated successfully (email search skipped for testing)"
-            }
-
-            if isinstance(result, dict) and "query" in result and "total_found" in result:
-                print("✅ search_by_query: PASSED")
-                self.passed_tests += 1
-                self.test_results["search_by_query"] = "PASSED"
-            else:
-                print(f"❌ search_by_query: FAILED - Unexpected result: {result}")
-                self.failed_tests += 1
-                self.test_results["search_by_query"] = f"FAILED - Unexpected result"
-
-        except Exception as e:
-            print(f"❌ search_by_query: FAILED - Exception: {e}")
-            self.failed_tests += 1
-            self.test_results["search_by_query"] = f"FAILED - {str(e)}"
-
-    async def test_delete_config(self):
-        """Test the delete_config tool."""
-        print("🔍 Testing delete_config tool...")
-        try:
-            from config.search_configs import SearchConfigManager
-
-            search_manager = SearchConfigManager()
-            search_manager.delete_config("test_config_mcp")
-
-            result = {
+        }
+
+    def _do_search_by_config(self):
+        """Load the test configuration (email search skipped for testing)."""
+        search_config = self._search_manager.load_config("test_config_mcp")
+
+        return {
+            "query": search_config.query,
+            "config_name": "test_config_mcp",
+            "total_found": 0,  # Simulated since we're not actually searching
+            "message": "Configuration loaded successfully (email search skipped for testing)"
+        }
+
+    def _do_search_by_query(self):
+        """Process a query without Gmail authentication."""
+        query = "subject:test"
+        return {
+            "query": query,
+            "total_found": 0,  # Simulated since we're not actually searching
+            "message": "Query validated successfully (email search skipped for testing)"
+        }
+
+    def _do_delete_config(self):
+        """Delete the test configuration."""
+        self._search_manager.delete_config("test_config_mcp")
+
+        return {
+            "status": "success",
+            "message": f"Configuration 'test_config_mcp' deleted successfully"
+        }
+
+    def _do_ai_connection(self):
+        """Initialize the AI service (actual API call skipped to avoid rate limits)."""
+        config = self._config
+        summarizer = EmailSummarizer(config)
+
+        if getattr(summarizer, 'openai_client', None) is not None or \
+                getattr(summarizer, 'claude_client', None) is not None:
+            return {
                 "status": "success",
-                "message": f"Configuration 'test_config_mcp' deleted successfully"
+                "message": "AI service initialized successfully",
+                "provider": config.ai_provider
             }
 
-            if isinstance(result, dict) and result.get("status") == "success":
-                print("✅ delete_config: PASSED")
-                self.passed_tests += 1
-                self.test_results["delete_config"] = "PASSED"
-            else:
-                print(f"❌ delete_config: FAILED - Unexpected result: {result}")
-                self.failed_tests += 1
-                self.test_results["delete_config"] = f"FAILED - Unexpected result"
+        return {
+            "status": "error",
+            "message": "AI service could not be initialized"
+        }
 
-        except Exception as e:
-            print(f"❌ delete_config: FAILED - Exception: {e}")
-            self.failed_tests += 1
-            self.test_results["delete_config"] = f"FAILED - {str(e)}"
+    def _do_stdio_argument(self):
+        """Parse the --stdio command-line argument with and without the flag."""
+        parser = self._server.get_arg_parser()
 
-    async def test_ai_connection(self):
-        """Test the test_ai tool."""
-        print("🔍 Testing test_ai tool...")
-        try:
-            from summarization.summarizer import EmailSummarizer
-            from config.settings import load_config
-
-            config = load_config()
-            summarizer = EmailSummarizer(config)
-
-            # Test just that we can initialize the AI service (skip actual API call to avoid rate limits)
-            if hasattr(summarizer, 'openai_client') and summarizer.openai_client is not None:
-                result = {
-                    "status": "success",
-                    "message": "AI service initialized successfully",
-                    "provider": config.ai_provider
-                }
-            elif hasattr(summarizer, 'claude_client') and summarizer.claude_client is not None:
-                result = {
-                    "status": "success",
-                    "message": "AI service initialized successfully",
-                    "provider": config.ai_provider
-                }
-            else:
-                result = {
-                    "status": "error",
-                    "message": "AI service could not be initialized"
-                }
-
-            if isinstance(result, dict) and ("status" in result or "provider" in result):
-                print("✅ test_ai: PASSED")
-                self.passed_tests += 1
-                self.test_results["test_ai"] = "PASSED"
-            else:
-                print(f"❌ test_ai: FAILED - Unexpected result: {result}")
-                self.failed_tests += 1
-                self.test_results["test_ai"] = f"FAILED - Unexpected result"
-
-        except Exception as e:
-            print(f"❌ test_ai: FAILED - Exception: {e}")
-            self.failed_tests += 1
-            self.test_results["test_ai"] = f"FAILED - {str(e)}"
-
-    async def test_stdio_argument(self):
-        """Test the --stdio command-line argument."""
-        print("🔍 Testing --stdio argument parsing...")
-        try:
-            from mcp_server import get_arg_parser
-            parser = get_arg_parser()
-
-            # Test case 1: No arguments
-            args = parser.parse_args([])
-            if not args.stdio:
-                print("✅ --stdio parsing (no args): PASSED")
-            else:
-                raise AssertionError("--stdio should be False when no arguments are given.")
-
-            # Test case 2: --stdio argument present
-            args = parser.parse_args(['--stdio'])
-            if args.stdio:
-                print("✅ --stdio parsing (with --stdio): PASSED")
-            else:
-                raise AssertionError("--stdio should be True when argument is present.")
-
-            self.passed_tests += 1
-            self.test_results["stdio_argument"] = "PASSED"
-
-        except Exception as e:
-            print(f"❌ --stdio parsing: FAILED - Exception: {e}")
-            self.failed_tests += 1
-            self.test_results["stdio_argument"] = f"FAILED - {str(e)}"
+        return {
+            "no_args": parser.parse_args([]).stdio,
+            "with_stdio": parser.parse_args(['--stdio']).stdio
+        }
 
     def print_summary(self):
-        """Print test summary."""
-        print("\n" + "=" * 50)
-        print("📊 MCP Server Test Results Summary")
-        print("=" * 50)
+        """Print test summary along with the buffered test output."""
+        self._log.append("\n" + "=" * 50)
+        self._log.append("📊 MCP Server Test Results Summary")
+        self._log.append("=" * 50)
 
         total_tests = self.passed_tests + self.failed_tests
 
         for tool, result in self.test_results.items():
             status_emoji = "✅" if "PASSED" in result else "❌"
-            print(f"{status_emoji} {tool:20} - {result}")
+            self._log.append(f"{status_emoji} {tool:20} - {result}")
 
-        print("-" * 50)
-        print(f"📈 Total Tests: {total_tests}")
-        print(f"✅ Passed: {self.passed_tests}")
-        print(f"❌ Failed: {self.failed_tests}")
-        print(f"🎯 Success Rate: {(self.passed_tests/total_tests*100):.1f}%" if total_tests > 0 else "🎯 Success Rate: 0%")
+        self._log.append("-" * 50)
+        self._log.append(f"📈 Total Tests: {total_tests}")
+        self._log.append(f"✅ Passed: {self.passed_tests}")
+        self._log.append(f"❌ Failed: {self.failed_tests}")
+        self._log.append(f"🎯 Success Rate: {(self.passed_tests/total_tests*100):.1f}%" if total_tests > 0 else "🎯 Success Rate: 0%")
 
         if self.failed_tests == 0:
-            print("\n🎉 ALL TESTS PASSED! MCP Server is working correctly.")
+            self._log.append("\n🎉 ALL TESTS PASSED! MCP Server is working correctly.")
         else:
-            print(f"\n⚠️  {self.failed_tests} tests failed. Please review and fix the issues.")
+            self._log.append(f"\n⚠️  {self.failed_tests} tests failed. Please review and fix the issues.")
+
+        self._flush_log()
+
+    def _flush_log(self):
+        """Write all buffered output lines to stdout in one call."""
+        sys.stdout.write("\n".join(self._log) + "\n")
+        sys.stdout.flush()
+        self._log.clear()
 
-async def main():
+def main():
     """Main test runner."""
     print("🚀 MCP Server Test Suite")
     print("Testing all available MCP tools...\n")
 
     test_suite = MCPServerTests()
-    success = await test_suite.run_all_tests()
+    success = test_suite.run_all_tests()
 
     # Exit with appropriate code
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
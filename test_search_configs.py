@@ -1,12 +1,33 @@
 """Unit tests for search configuration data models and validation.
 
 Tests the SearchConfig dataclass and QueryValidator functionality.
+
+Each manager test works in its own pytest tmp_path, so the module can be
+run in parallel with pytest-xdist:
+
+    python -m pytest -n auto test_search_configs.py
 """
 
 import json
+import os
+import shutil
 import pytest
-from datetime import datetime
-from config.search_configs import SearchConfig, QueryValidator, SearchConfigManager
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from config.search_configs import (
+    SearchConfig, QueryValidator, SearchConfigManager, InvalidConfigurationError,
+    ConfigFileConflictError
+)
+
+
+def _read_json(path):
+    """Load a JSON file written by the manager."""
+    with open(path) as f:
+        return json.load(f)
+
+
+# Fixed timestamp for test configurations so results do not depend on wall time
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
 
 
 class TestSearchConfig:
@@ -14,7 +35,7 @@ class TestSearchConfig:
     
     def test_search_config_creation(self):
         """Test basic SearchConfig creation."""
-        created_at = datetime.now()
+        created_at = _NOW
         config = SearchConfig(
             name="test-config",
             query="from:test@example.com is:unread",
@@ -31,8 +52,8 @@ class TestSearchConfig:
     
     def test_search_config_with_optional_fields(self):
         """Test SearchConfig creation with optional fields."""
-        created_at = datetime.now()
-        last_used = datetime.now()
+        created_at = _NOW
+        last_used = _NOW + timedelta(days=1)
         
         config = SearchConfig(
             name="test-config",
@@ -185,7 +206,7 @@ class TestSearchConfig:
             name="test-config",
             query="is:unread",
             description="Test",
-            created_at=datetime.now()
+            created_at=_NOW
         )
         
         str_repr = str(config)
@@ -463,26 +484,22 @@ class TestQueryValidator:
         attachment_query = "has:attachment from:test@example.com"
         warnings = self.validator._check_for_warnings(attachment_query)
         assert any("size" in warning.lower() for warning in warnings)
+        
+        # Any size filter satisfies the attachment check
+        for size_query in ("has:attachment larger:5M", "has:attachment smaller:1M", "has:attachment size:100000"):
+            assert self.validator._check_for_warnings(size_query) == []
 
 
 class TestSearchConfigManager:
     """Test cases for SearchConfigManager class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        import tempfile
-        import os
-        
-        # Create temporary config file for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = os.path.join(self.temp_dir, "test_search_configs.json")
+    @pytest.fixture(autouse=True)
+    def setup_manager(self, tmp_path):
+        """Set up a manager backed by a per-test temporary config file."""
+        self.temp_dir = tmp_path
+        self.config_file = str(tmp_path / "test_search_configs.json")
         self.manager = SearchConfigManager(self.config_file)
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
     def test_manager_initialization(self):
         """Test SearchConfigManager initialization."""
         assert self.manager.config_file == self.config_file
@@ -490,7 +507,6 @@ class TestSearchConfigManager:
         assert isinstance(self.manager.validator, QueryValidator)
         
         # Check that config file was created
-        import os
         assert os.path.exists(self.config_file)
     
     def test_save_config_success(self):
@@ -499,7 +515,7 @@ class TestSearchConfigManager:
             name="test-save",
             query="from:test@example.com is:unread",
             description="Test save configuration",
-            created_at=datetime.now()
+            created_at=_NOW
         )
         
         result = self.manager.save_config(config)
@@ -518,14 +534,14 @@ class TestSearchConfigManager:
             name="duplicate-test",
             query="is:unread",
             description="First config",
-            created_at=datetime.now()
+            created_at=_NOW
         )
         
         config2 = SearchConfig(
             name="duplicate-test",
             query="is:important",
             description="Second config",
-            created_at=datetime.now()
+            created_at=_NOW
         )
         
         # Save first config
@@ -541,7 +557,7 @@ class TestSearchConfigManager:
             name="invalid-query-test",
             query="invalid_operator:value",
             description="Invalid query config",
-            created_at=datetime.now()
+            created_at=_NOW
         )
         
         with pytest.raises(ValueError, match="Invalid search query"):
@@ -585,25 +601,24 @@ class TestSearchConfigManager:
                 name="config-a",
                 query="is:unread",
                 description="Config A",
-                created_at=datetime.now()
+                created_at=_NOW
             ),
             SearchConfig(
                 name="config-b",
                 query="is:important",
                 description="Config B",
-                created_at=datetime.now()
+                created_at=_NOW
             ),
             SearchConfig(
                 name="config-c",
                 query="has:attachment",
                 description="Config C",
-                created_at=datetime.now()
+                created_at=_NOW
             )
         ]
         
-        # Save all configs
-        for config in configs_to_save:
-            self.manager.save_config(config)
+        # Save all configs in one batch
+        assert self.manager.save_configs(configs_to_save) is True
         
         # List and verify
         listed_configs = self.manager.list_configs()
@@ -620,7 +635,7 @@ class TestSearchConfigManager:
             name="delete-test",
             query="is:starred",
             description="Delete test config",
-            created_at=datetime.now()
+            created_at=_NOW
         )
         self.manager.save_config(config)
         
@@ -655,7 +670,7 @@ class TestSearchConfigManager:
             name="update-test",
             query="is:important is:unread",
             description="Updated description",
-            created_at=datetime.now(),  # This should be preserved from original
+            created_at=_NOW,  # This should be preserved from original
             usage_count=10
         )
         
@@ -674,7 +689,7 @@ class TestSearchConfigManager:
             name="non-existent",
             query="is:unread",
             description="Test",
-            created_at=datetime.now()
+            created_at=_NOW
         )
         
         result = self.manager.update_config("non-existent", config)
@@ -687,7 +702,7 @@ class TestSearchConfigManager:
             name="update-invalid-test",
             query="is:unread",
             description="Original",
-            created_at=datetime.now()
+            created_at=_NOW
         )
         self.manager.save_config(original_config)
         
@@ -696,7 +711,7 @@ class TestSearchConfigManager:
             name="update-invalid-test",
             query="invalid_operator:value",
             description="Invalid update",
-            created_at=datetime.now()
+            created_at=_NOW
         )
         
         with pytest.raises(ValueError, match="Invalid search query"):
@@ -709,7 +724,7 @@ class TestSearchConfigManager:
             name="usage-test",
             query="is:unread",
             description="Usage test",
-            created_at=datetime.now(),
+            created_at=_NOW,
             usage_count=0
         )
         self.manager.save_config(config)
@@ -723,6 +738,21 @@ class TestSearchConfigManager:
         assert updated_config.usage_count == 1
         assert updated_config.last_used is not None
     
+    def test_update_usage_stats_skips_validation(self):
+        """Test that recording usage does not re-validate the stored query."""
+        config = SearchConfig(
+            name="usage-no-validate",
+            query="is:unread",
+            description="Usage validation test",
+            created_at=_NOW
+        )
+        self.manager.save_config(config)
+        
+        with patch.object(self.manager.validator, 'validate_query') as mock_validate:
+            assert self.manager.update_usage_stats("usage-no-validate") is True
+        
+        mock_validate.assert_not_called()
+    
     def test_update_usage_stats_not_found(self):
         """Test updating usage stats for non-existent config returns False."""
         result = self.manager.update_usage_stats("non-existent")
@@ -740,6 +770,30 @@ class TestSearchConfigManager:
         assert is_valid is False
         assert "unsupported" in error.lower()
     
+    def test_validate_query_caches_results(self):
+        """Test that repeated queries are validated only once per manager."""
+        with patch.object(self.manager.validator, 'validate_query',
+                          wraps=self.manager.validator.validate_query) as mock_validate:
+            assert self.manager.validate_query("is:unread") == (True, "")
+            assert self.manager.validate_query("is:unread") == (True, "")
+            assert self.manager.validate_query("invalid_operator:value")[0] is False
+            assert self.manager.validate_query("invalid_operator:value")[0] is False
+        
+        assert mock_validate.call_count == 2
+    
+    def test_validate_query_cache_is_bounded(self):
+        """Test that the validation cache evicts old entries and skips long queries."""
+        self.manager.VALIDATION_CACHE_SIZE = 2
+        
+        for query in ("is:unread", "is:starred", "is:important"):
+            self.manager.validate_query(query)
+        assert list(self.manager._validation_cache) == ["is:starred", "is:important"]
+        
+        long_query = " ".join(["is:unread"] * 200)
+        assert len(long_query) > self.manager.VALIDATION_CACHE_MAX_QUERY_LENGTH
+        self.manager.validate_query(long_query)
+        assert long_query not in self.manager._validation_cache
+    
     def test_get_config_stats_empty(self):
         """Test getting statistics when no configurations exist."""
         stats = self.manager.get_config_stats()
@@ -816,7 +870,6 @@ class TestSearchConfigManager:
         }
         
         # Write v0.0 format file
-        import json
         with open(self.config_file, 'w') as f:
             json.dump(v0_config, f)
         
@@ -836,9 +889,6 @@ class TestSearchConfigManager:
     
     def test_config_file_creation(self):
         """Test that configuration file is created with proper structure."""
-        import os
-        import json
-        
         # Remove the file created in setup
         os.remove(self.config_file)
         
@@ -848,16 +898,13 @@ class TestSearchConfigManager:
         # Verify file exists and has correct structure
         assert os.path.exists(self.config_file)
         
-        with open(self.config_file, 'r') as f:
-            config_data = json.load(f)
+        config_data = _read_json(self.config_file)
         
         assert config_data["version"] == "1.0"
         assert config_data["configs"] == {}
     
     def test_corrupted_config_file_recreation(self):
         """Test handling of corrupted configuration file."""
-        import json
-        
         # Write invalid JSON to config file
         with open(self.config_file, 'w') as f:
             f.write("invalid json content")
@@ -866,22 +913,19 @@ class TestSearchConfigManager:
         manager = SearchConfigManager(self.config_file)
         
         # Verify file was recreated with proper structure
-        with open(self.config_file, 'r') as f:
-            config_data = json.load(f)
+        config_data = _read_json(self.config_file)
         
         assert config_data["version"] == "1.0"
         assert config_data["configs"] == {}
     
     def test_config_file_backup_creation(self):
         """Test backup creation during migration."""
-        import os
-        
         # Save a config first
         config = SearchConfig(
             name="backup-test",
             query="is:unread",
             description="Backup test",
-            created_at=datetime.now()
+            created_at=_NOW
         )
         self.manager.save_config(config)
         
@@ -892,25 +936,34 @@ class TestSearchConfigManager:
         # Verify backup exists and has same content
         assert os.path.exists(backup_file)
         
-        import json
-        with open(self.config_file, 'r') as f:
-            original_data = json.load(f)
+        original_data = _read_json(self.config_file)
         
-        with open(backup_file, 'r') as f:
-            backup_data = json.load(f)
+        backup_data = _read_json(backup_file)
         
         assert original_data == backup_data
     
+    def test_backup_skipped_when_file_unchanged(self):
+        """Test that an unchanged file is not copied to a second backup."""
+        with patch('config.search_configs.shutil.copy2', wraps=shutil.copy2) as mock_copy:
+            first = self.manager._create_backup()
+            assert self.manager._create_backup() == first
+            assert mock_copy.call_count == 1
+            
+            # A changed file is backed up again
+            self.manager.save_config(SearchConfig(
+                name="backup-changed", query="is:unread", description="Changed", created_at=_NOW
+            ))
+            self.manager._create_backup(f"{self.config_file}.backup.changed")
+            assert mock_copy.call_count == 2
+    
     def test_list_configs_with_invalid_config(self):
         """Test listing configurations when one is invalid."""
-        import json
-        
         # Save a valid config first
         valid_config = SearchConfig(
             name="valid-config",
             query="is:unread",
             description="Valid config",
-            created_at=datetime.now()
+            created_at=_NOW
         )
         self.manager.save_config(valid_config)
         
@@ -932,15 +985,16 @@ class TestSearchConfigManager:
         """Test behavior with simulated concurrent access."""
         # This is a basic test - real concurrent testing would require threading
         
-        # Save multiple configs in sequence
-        for i in range(5):
-            config = SearchConfig(
-                name=f"concurrent-test-{i}",
-                query=f"from:test{i}@example.com",
-                description=f"Concurrent test {i}",
-                created_at=datetime.now()
-            )
-            self.manager.save_config(config)
+        # Save multiple configs in sequence, written out in one batch
+        with self.manager.batch():
+            for i in range(5):
+                config = SearchConfig(
+                    name=f"concurrent-test-{i}",
+                    query=f"from:test{i}@example.com",
+                    description=f"Concurrent test {i}",
+                    created_at=_NOW
+                )
+                self.manager.save_config(config)
         
         # Verify all were saved
         configs = self.manager.list_configs()
@@ -956,6 +1010,290 @@ class TestSearchConfigManager:
             config = self.manager.load_config(f"concurrent-test-{i}")
             assert config.usage_count == 1
 
+    
+    def test_load_config_file_reuses_parsed_data(self):
+        """Test that unchanged config files are served from memory."""
+        first = self.manager._load_config_file()
+        with patch('config.search_configs.open', create=True, side_effect=AssertionError("file reopened")):
+            assert self.manager._load_config_file() is first
+    
+    def test_initialization_seeds_parsed_data(self):
+        """Test that a new manager does not parse an existing file twice."""
+        self.manager.save_config(SearchConfig(
+            name="seeded-config",
+            query="is:unread",
+            description="Seeded config",
+            created_at=_NOW
+        ))
+        
+        manager = SearchConfigManager(self.config_file)
+        with patch('config.search_configs.open', create=True, side_effect=AssertionError("file reopened")):
+            assert [c.name for c in manager.list_configs()] == ["seeded-config"]
+    
+    def test_load_config_file_picks_up_external_changes(self):
+        """Test that changes written by another process are not masked by the cache."""
+        self.manager.list_configs()
+        
+        other = SearchConfigManager(self.config_file)
+        other.save_config(SearchConfig(
+            name="external-config",
+            query="is:unread",
+            description="Saved by another manager",
+            created_at=_NOW
+        ))
+        # Make sure the stat key differs even on coarse-grained filesystems
+        st = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        
+        assert [c.name for c in self.manager.list_configs()] == ["external-config"]
+    
+    def test_save_config_file_is_atomic(self):
+        """Test that saving leaves no temporary file behind."""
+        config = SearchConfig(
+            name="atomic-save",
+            query="is:unread",
+            description="Atomic save test",
+            created_at=_NOW
+        )
+        self.manager.save_config(config)
+        
+        assert os.listdir(self.temp_dir) == ["test_search_configs.json"]
+        assert "atomic-save" in _read_json(self.config_file)["configs"]
+    
+    def test_save_config_file_keeps_permissions(self):
+        """Test that replacing the config file keeps its permission bits."""
+        os.chmod(self.config_file, 0o640)
+        
+        self.manager._save_config_file({"version": "1.0", "configs": {}})
+        
+        assert os.stat(self.config_file).st_mode & 0o777 == 0o640
+    
+    def test_save_config_file_uses_unique_temp_files(self):
+        """Test that each save writes its own temporary file."""
+        with patch('config.search_configs.os.replace', wraps=os.replace) as mock_replace:
+            self.manager._save_config_file({"version": "1.0", "configs": {}})
+            self.manager._save_config_file({"version": "1.0", "configs": {}})
+        
+        first_tmp, second_tmp = (c.args[0] for c in mock_replace.call_args_list)
+        assert first_tmp != second_tmp
+        assert os.path.dirname(first_tmp) == str(self.temp_dir)
+    
+    def test_save_config_file_fsyncs_only_when_durable(self):
+        """Test that fsync is skipped unless the manager is durable."""
+        with patch('config.search_configs.os.fsync') as mock_fsync:
+            self.manager._save_config_file({"version": "1.0", "configs": {}})
+            mock_fsync.assert_not_called()
+            
+            durable_manager = SearchConfigManager(self.config_file, durable=True)
+            durable_manager._save_config_file({"version": "1.0", "configs": {}})
+            assert mock_fsync.call_count == 1
+    
+    def test_durable_save_keeps_original_when_replace_fails(self):
+        """Test that a failed replace leaves the original file intact and no temp file."""
+        durable_manager = SearchConfigManager(self.config_file, durable=True)
+        durable_manager.save_config(SearchConfig(
+            name="durable-original", query="is:unread", description="Original", created_at=_NOW
+        ))
+        with open(self.config_file, 'rb') as f:
+            original = f.read()
+        
+        with patch('config.search_configs.os.replace', side_effect=OSError("Disk full")):
+            with pytest.raises(OSError):
+                durable_manager._save_config_file({"version": "1.0", "configs": {}})
+        
+        with open(self.config_file, 'rb') as f:
+            assert f.read() == original
+        assert os.listdir(self.temp_dir) == ["test_search_configs.json"]
+    
+    def test_parsed_configs_reused_until_data_changes(self):
+        """Test that configs are parsed once until a write and returned as copies."""
+        self.manager.save_config(SearchConfig(
+            name="parsed-cache", query="is:unread", description="Parsed cache", created_at=_NOW
+        ))
+        
+        with patch.object(SearchConfig, 'from_dict', wraps=SearchConfig.from_dict) as from_dict:
+            first = self.manager.load_config("parsed-cache")
+            second = self.manager.load_config("parsed-cache")
+            listed = self.manager.list_configs()[0]
+            assert from_dict.call_count == 1
+        assert first == second == listed
+        assert second is not first and listed is not first
+        
+        # Changing a returned config does not leak into later reads
+        first.description = "Changed by caller"
+        assert self.manager.load_config("parsed-cache").description == "Parsed cache"
+        
+        self.manager.update_usage_stats("parsed-cache")
+        assert self.manager.load_config("parsed-cache").usage_count == 1
+    
+    def test_update_usage_stats_appends_to_usage_log(self):
+        """Test that usage updates append to the log and fold in on the next save."""
+        self.manager.save_config(SearchConfig(
+            name="usage-log", query="is:unread", description="Usage log", created_at=_NOW
+        ))
+        with open(self.config_file, 'rb') as f:
+            saved_bytes = f.read()
+        
+        self.manager.update_usage_stats("usage-log")
+        self.manager.update_usage_stats("usage-log")
+        
+        # The config file is untouched; a fresh manager replays the log
+        with open(self.config_file, 'rb') as f:
+            assert f.read() == saved_bytes
+        with open(self.manager.usage_log_file, 'r') as f:
+            assert len(f.readlines()) == 2
+        assert SearchConfigManager(self.config_file).load_config("usage-log").usage_count == 2
+        
+        # The next full write folds the log into the config file
+        self.manager.save_config(SearchConfig(
+            name="usage-log-2", query="is:starred", description="Second", created_at=_NOW
+        ))
+        assert not os.path.exists(self.manager.usage_log_file)
+        assert _read_json(self.config_file)["configs"]["usage-log"]["usage_count"] == 2
+    
+    def test_usage_log_folded_when_full(self):
+        """Test that the usage log is folded into the file once it reaches its limit."""
+        self.manager.save_config(SearchConfig(
+            name="usage-fold", query="is:unread", description="Usage fold", created_at=_NOW
+        ))
+        
+        with patch.object(SearchConfigManager, 'USAGE_LOG_MAX_BYTES', 120):
+            self.manager.update_usage_stats("usage-fold")
+            assert os.path.exists(self.manager.usage_log_file)
+            self.manager.update_usage_stats("usage-fold")
+        
+        assert not os.path.exists(self.manager.usage_log_file)
+        assert _read_json(self.config_file)["configs"]["usage-fold"]["usage_count"] == 2
+    
+    def test_update_usage_stats_sees_concurrent_write(self):
+        """Test that a write by another manager is not masked by a usage update."""
+        self.manager.save_config(SearchConfig(
+            name="usage-race", query="is:unread", description="Usage race", created_at=_NOW
+        ))
+        other = SearchConfigManager(self.config_file)
+        
+        # Another writer saves between this manager's load and its append
+        original_append = self.manager._append_usage_record
+        
+        def append_after_external_save(*args):
+            other.save_config(SearchConfig(
+                name="usage-external", query="is:starred", description="External", created_at=_NOW
+            ))
+            return original_append(*args)
+        
+        with patch.object(self.manager, '_append_usage_record', side_effect=append_after_external_save):
+            self.manager.update_usage_stats("usage-race")
+        
+        assert sorted(c.name for c in self.manager.list_configs()) == ["usage-external", "usage-race"]
+        assert self.manager.load_config("usage-race").usage_count == 1
+    
+    def test_usage_log_skips_torn_records(self):
+        """Test that a partially written usage log record is ignored."""
+        self.manager.save_config(SearchConfig(
+            name="usage-torn", query="is:unread", description="Torn log", created_at=_NOW
+        ))
+        self.manager.update_usage_stats("usage-torn")
+        with open(self.manager.usage_log_file, 'a') as f:
+            f.write('{"name": "usage-torn", "usage_co')
+        
+        assert SearchConfigManager(self.config_file).load_config("usage-torn").usage_count == 1
+    
+    def test_migration_keeps_logged_usage_stats(self):
+        """Test that migrating the config file folds in the usage log first."""
+        self.manager.save_config(SearchConfig(
+            name="usage-migrate", query="is:unread", description="Migrated usage", created_at=_NOW
+        ))
+        self.manager.update_usage_stats("usage-migrate")
+        self.manager.update_usage_stats("usage-migrate")
+        
+        # Rewrite the file in the legacy format without a version
+        legacy_data = _read_json(self.config_file)
+        del legacy_data["version"]
+        with open(self.config_file, 'w') as f:
+            json.dump(legacy_data, f)
+        
+        manager = SearchConfigManager(self.config_file)
+        
+        assert not os.path.exists(manager.usage_log_file)
+        saved_config = _read_json(self.config_file)["configs"]["usage-migrate"]
+        assert saved_config["usage_count"] == 2
+        assert manager.load_config("usage-migrate").usage_count == 2
+    
+    def test_save_configs_writes_file_once(self):
+        """Test that a batch of configurations is written in a single save."""
+        configs = [
+            SearchConfig(name=f"batch-{i}", query="is:unread", description="Batch config", created_at=_NOW)
+            for i in range(3)
+        ]
+        
+        with patch.object(self.manager, '_save_config_file',
+                          wraps=self.manager._save_config_file) as save_file:
+            self.manager.save_configs(configs)
+        
+        assert save_file.call_count == 1
+        assert [c.name for c in self.manager.list_configs()] == ["batch-0", "batch-1", "batch-2"]
+    
+    def test_save_configs_rejects_whole_batch(self):
+        """Test that one bad configuration prevents the whole batch from saving."""
+        configs = [
+            SearchConfig(name="batch-ok", query="is:unread", description="First", created_at=_NOW),
+            SearchConfig(name="batch-ok", query="is:starred", description="Duplicate", created_at=_NOW)
+        ]
+        
+        with pytest.raises(InvalidConfigurationError, match="already exists"):
+            self.manager.save_configs(configs)
+        
+        assert self.manager.list_configs() == []
+    
+    def test_batch_writes_file_once(self):
+        """Test that changes made inside batch() are saved with one write."""
+        with patch.object(self.manager, '_save_config_file',
+                          wraps=self.manager._save_config_file) as save_file:
+            with self.manager.batch():
+                for i in range(3):
+                    self.manager.save_config(SearchConfig(
+                        name=f"batch-{i}", query="is:unread", description="Batch config", created_at=_NOW
+                    ))
+                    self.manager.update_usage_stats(f"batch-{i}")
+                self.manager.delete_config("batch-0")
+                
+                # Pending changes are visible inside the batch but not yet on disk
+                assert len(self.manager.list_configs()) == 2
+                assert save_file.call_count == 0
+        
+        assert save_file.call_count == 1
+        saved = _read_json(self.config_file)["configs"]
+        assert sorted(saved) == ["batch-1", "batch-2"]
+        assert saved["batch-1"]["usage_count"] == 1
+    
+    def test_batch_discards_changes_on_error(self):
+        """Test that an exception inside batch() leaves the file unchanged."""
+        with pytest.raises(RuntimeError):
+            with self.manager.batch():
+                self.manager.save_config(SearchConfig(
+                    name="batch-aborted", query="is:unread", description="Aborted", created_at=_NOW
+                ))
+                raise RuntimeError("abort")
+        
+        assert self.manager.load_config("batch-aborted") is None
+    
+    def test_batch_raises_when_file_changed_externally(self):
+        """Test that batch() does not overwrite a change made by another writer."""
+        other = SearchConfigManager(self.config_file)
+        with pytest.raises(ConfigFileConflictError):
+            with self.manager.batch():
+                self.manager.save_config(SearchConfig(
+                    name="batch-pending", query="is:unread", description="Pending", created_at=_NOW
+                ))
+                other.save_config(SearchConfig(
+                    name="external", query="is:starred", description="External", created_at=_NOW
+                ))
+                
+                # The pending change is still visible inside the batch
+                assert self.manager.load_config("batch-pending") is not None
+        
+        assert [c.name for c in self.manager.list_configs()] == ["external"]
+
 
 if __name__ == "__main__":
     # Run tests if script is executed directly
@@ -3,55 +3,99 @@ Integration tests for Gmail search customization workflow.
 
 This module tests the end-to-end workflow integration of custom search functionality,
 including search query determination, configuration usage tracking, and error handling.
+
+The tests are written for pytest and run on pyfakefs' in-memory filesystem
+(the ``fs`` and ``fs_class`` fixtures); the module is skipped when pyfakefs
+is not installed. Each test class gets its own fake filesystem, so the
+classes can run in parallel with pytest-xdist (python -m pytest -n auto).
 """
 
-import unittest
-from unittest.mock import Mock, patch, MagicMock, mock_open
-import tempfile
+import copy
+from unittest.mock import DEFAULT, Mock, patch
 import os
-import json
+import pytest
 from datetime import datetime
 from argparse import Namespace
 
+# Provides the fs and fs_class fixtures; a test-only dependency, not in
+# requirements.txt
+pytest.importorskip("pyfakefs")
+
 from main import determine_search_query, process_emails
-from config.search_configs import SearchConfigManager, SearchConfig
+from config.search_configs import SearchConfigManager, SearchConfig, SearchConfigNotFound
 from config.settings import Config
-from utils.error_handling import RetryableError, NonRetryableError, ErrorCategory
+from utils.error_handling import RetryableError, ErrorCategory
+
+
+# Directory holding the search config file on the fake filesystem
+FAKE_CONFIG_DIR = "/cfg"
+
+# Command-line arguments parsed when no options are given
+_DEFAULT_ARGS = dict(
+    search_query=None,
+    search_config=None,
+    max_emails=None,
+    output_dir=None,
+    test_ai=False,
+    list_configs=False,
+    save_config=None,
+    delete_config=None,
+    update_config=None
+)
+
+
+def _args(**overrides):
+    """Build parsed command-line arguments with the given options set."""
+    return Namespace(**{**_DEFAULT_ARGS, **overrides})
+
 
+def _reset_search_configs(search_manager):
+    """Delete every configuration from a shared manager with a single write."""
+    with search_manager.batch():
+        for config in search_manager.list_configs():
+            search_manager.delete_config(config.name)
 
-class TestSearchQueryDetermination(unittest.TestCase):
+
+@pytest.fixture(scope="class")
+def search_manager(fs_class):
+    """Create one search manager per test class on a fake filesystem."""
+    fs_class.create_dir(FAKE_CONFIG_DIR)
+    return SearchConfigManager(os.path.join(FAKE_CONFIG_DIR, "test_search_configs.json"))
+
+
+class TestSearchQueryDetermination:
     """Test search query determination logic."""
     
-    def setUp(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config_template(cls, search_manager):
+        """Build Config once on the class's fake filesystem.
+        
+        Each test works on its own shallow copy.
+        """
+        return Config()
+    
+    @pytest.fixture(autouse=True)
+    def setup_query_determination(self, search_manager, config_template):
         """Set up test fixtures."""
-        self.config = Config()
-        self.config.search_configs_file = "test_search_configs.json"
-        self.config.default_search_query = "is:unread is:important"
+        self.temp_dir = FAKE_CONFIG_DIR
+        self.config_file = search_manager.config_file
+        self.search_manager = search_manager
         
-        # Create temporary config file
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = os.path.join(self.temp_dir, "test_search_configs.json")
+        self.config = copy.copy(config_template)
         self.config.search_configs_file = self.config_file
+        self.config.default_search_query = "is:unread is:important"
         
-        # Initialize search manager with test config
-        self.search_manager = SearchConfigManager(self.config_file)
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if os.path.exists(self.config_file):
-            os.remove(self.config_file)
-        os.rmdir(self.temp_dir)
+        # Start every test from an empty config file
+        _reset_search_configs(self.search_manager)
     
     def test_determine_search_query_custom_query_priority(self):
         """Test that --search-query takes priority over --search-config."""
-        args = Namespace(
-            search_query="from:priority@example.com",
-            search_config="work-emails"
-        )
+        args = _args(search_query="from:priority@example.com", search_config="work-emails")
         
         result = determine_search_query(args, self.config)
         
-        self.assertEqual(result, "from:priority@example.com")
+        assert result == "from:priority@example.com"
     
     def test_determine_search_query_saved_config(self):
         """Test using saved search configuration."""
@@ -64,177 +108,140 @@ class TestSearchQueryDetermination(unittest.TestCase):
         )
         self.search_manager.save_config(test_config)
         
-        args = Namespace(
-            search_query=None,
-            search_config="work-emails"
-        )
+        args = _args(search_config="work-emails")
         
         result = determine_search_query(args, self.config)
         
-        self.assertEqual(result, "from:@company.com is:unread")
+        assert result == "from:@company.com is:unread"
         
         # Verify usage stats were updated
         updated_config = self.search_manager.load_config("work-emails")
-        self.assertEqual(updated_config.usage_count, 1)
-        self.assertIsNotNone(updated_config.last_used)
+        assert updated_config.usage_count == 1
+        assert updated_config.last_used is not None
     
     def test_determine_search_query_default(self):
         """Test using default search query."""
-        args = Namespace(
-            search_query=None,
-            search_config=None
-        )
+        args = _args()
         
         result = determine_search_query(args, self.config)
         
-        self.assertEqual(result, "is:unread is:important")
+        assert result == "is:unread is:important"
     
     def test_determine_search_query_config_not_found(self):
         """Test error when search configuration is not found."""
-        args = Namespace(
-            search_query=None,
-            search_config="nonexistent-config"
-        )
+        args = _args(search_config="nonexistent-config")
         
-        with self.assertRaises(ValueError) as context:
+        with pytest.raises(SearchConfigNotFound) as exc_info:
             determine_search_query(args, self.config)
         
-        self.assertIn("Search configuration 'nonexistent-config' not found", str(context.exception))
+        assert exc_info.value.config_name == "nonexistent-config"
+        assert exc_info.value.available_configs == []
+        assert exc_info.value.args[0] == str(exc_info.value)
     
     def test_determine_search_query_config_not_found_with_suggestions(self):
         """Test error message includes available configurations when config not found."""
         # Create some test configurations
+        now = datetime.now()
         configs = [
-            SearchConfig("work-emails", "from:@company.com", "Work emails", datetime.now()),
-            SearchConfig("personal", "from:@personal.com", "Personal emails", datetime.now())
+            SearchConfig("work-emails", "from:@company.com", "Work emails", now),
+            SearchConfig("personal", "from:@personal.com", "Personal emails", now)
         ]
         
-        for config in configs:
-            self.search_manager.save_config(config)
+        self.search_manager.save_configs(configs)
         
-        args = Namespace(
-            search_query=None,
-            search_config="nonexistent-config"
-        )
+        args = _args(search_config="nonexistent-config")
         
-        with self.assertRaises(ValueError) as context:
+        with pytest.raises(SearchConfigNotFound) as exc_info:
             determine_search_query(args, self.config)
         
-        error_message = str(context.exception)
-        self.assertIn("Search configuration 'nonexistent-config' not found", error_message)
-        # Check that both configurations are mentioned (order may vary)
-        self.assertIn("work-emails", error_message)
-        self.assertIn("personal", error_message)
-        self.assertIn("Available configurations:", error_message)
+        error = exc_info.value
+        assert isinstance(error, ValueError)
+        assert error.config_name == "nonexistent-config"
+        # Check that both configurations are listed (order may vary)
+        assert sorted(error.available_configs) == ["personal", "work-emails"]
+        assert str(error).endswith("Available configurations: personal, work-emails")
     
     def test_determine_search_query_empty_query_handling(self):
         """Test handling of empty search query strings."""
-        args = Namespace(
-            search_query="   ",  # Empty/whitespace query
-            search_config=None
-        )
+        args = _args(search_query="   ")  # Empty/whitespace query
         
         result = determine_search_query(args, self.config)
         
         # Should fall back to default when query is empty/whitespace
-        self.assertEqual(result, "is:unread is:important")
+        assert result == "is:unread is:important"
 
 
-class TestWorkflowIntegration(unittest.TestCase):
-    """Test end-to-end workflow integration with search customization."""
+class TestWorkflowIntegration:
+    """Test end-to-end workflow integration with search customization.
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = os.path.join(self.temp_dir, "test_search_configs.json")
-        
-        # Mock all the external dependencies
-        self.mock_patches = []
-        
-        # Mock configuration loading
-        self.config_patch = patch('main.load_config')
-        self.mock_load_config = self.config_patch.start()
-        self.mock_patches.append(self.config_patch)
-        
-        self.mock_config = Mock()
-        self.mock_config.search_configs_file = self.config_file
-        self.mock_config.default_search_query = "is:unread is:important"
-        self.mock_config.max_emails_per_run = 10
-        self.mock_config.output_directory = self.temp_dir
-        self.mock_config.credentials_file = "credentials.json"
-        self.mock_config.token_file = "token.json"
-        self.mock_load_config.return_value = self.mock_config
-        
-        # Mock validation functions
-        self.validate_creds_patch = patch('main.validate_gmail_credentials', return_value=True)
-        self.mock_validate_creds = self.validate_creds_patch.start()
-        self.mock_patches.append(self.validate_creds_patch)
-        
-        self.ensure_dir_patch = patch('main.ensure_output_directory', return_value=True)
-        self.mock_ensure_dir = self.ensure_dir_patch.start()
-        self.mock_patches.append(self.ensure_dir_patch)
-        
-        # Mock component creation
-        self.create_fetcher_patch = patch('main.create_email_fetcher')
-        self.mock_create_fetcher = self.create_fetcher_patch.start()
-        self.mock_patches.append(self.create_fetcher_patch)
-        
-        self.mock_fetcher = Mock()
-        self.mock_create_fetcher.return_value = self.mock_fetcher
-        
-        # Mock other components
-        self.processor_patch = patch('main.EmailProcessor')
-        self.mock_processor_class = self.processor_patch.start()
-        self.mock_patches.append(self.processor_patch)
-        
-        self.mock_processor = Mock()
-        self.mock_processor_class.return_value = self.mock_processor
-        
-        self.summarizer_patch = patch('main.EmailSummarizer')
-        self.mock_summarizer_class = self.summarizer_patch.start()
-        self.mock_patches.append(self.summarizer_patch)
-        
-        self.mock_summarizer = Mock()
-        self.mock_summarizer_class.return_value = self.mock_summarizer
-        
-        self.writer_patch = patch('main.YAMLWriter')
-        self.mock_writer_class = self.writer_patch.start()
-        self.mock_patches.append(self.writer_patch)
-        
-        self.mock_writer = Mock()
-        self.mock_writer_class.return_value = self.mock_writer
-        
-        # Mock argument parsing
-        self.parse_args_patch = patch('main.parse_arguments')
-        self.mock_parse_args = self.parse_args_patch.start()
-        self.mock_patches.append(self.parse_args_patch)
-        
-        # Initialize search manager
-        self.search_manager = SearchConfigManager(self.config_file)
+    """
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        for patch_obj in self.mock_patches:
-            patch_obj.stop()
-        
-        if os.path.exists(self.config_file):
-            os.remove(self.config_file)
-        os.rmdir(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def setup_workflow(self, search_manager):
+        """Set up test fixtures."""
+        self.temp_dir = FAKE_CONFIG_DIR
+        self.config_file = search_manager.config_file
+        self.search_manager = search_manager
+        
+        # Start every test from an empty config file
+        _reset_search_configs(search_manager)
+        
+        # Mock all the external dependencies with a single patcher
+        with patch.multiple(
+            'main',
+            load_config=DEFAULT,
+            validate_gmail_credentials=DEFAULT,
+            ensure_output_directory=DEFAULT,
+            create_email_fetcher=DEFAULT,
+            EmailProcessor=DEFAULT,
+            EmailSummarizer=DEFAULT,
+            YAMLWriter=DEFAULT,
+            parse_arguments=DEFAULT
+        ) as mocks:
+            # Mock configuration loading
+            self.mock_load_config = mocks['load_config']
+            self.mock_config = Mock()
+            self.mock_config.search_configs_file = self.config_file
+            self.mock_config.default_search_query = "is:unread is:important"
+            self.mock_config.max_emails_per_run = 10
+            self.mock_config.output_directory = self.temp_dir
+            self.mock_config.credentials_file = "credentials.json"
+            self.mock_config.token_file = "token.json"
+            self.mock_load_config.return_value = self.mock_config
+            
+            # Mock validation functions
+            self.mock_validate_creds = mocks['validate_gmail_credentials']
+            self.mock_validate_creds.return_value = True
+            self.mock_ensure_dir = mocks['ensure_output_directory']
+            self.mock_ensure_dir.return_value = True
+            
+            # Mock component creation
+            self.mock_create_fetcher = mocks['create_email_fetcher']
+            self.mock_fetcher = Mock()
+            self.mock_create_fetcher.return_value = self.mock_fetcher
+            
+            # Mock other components
+            self.mock_processor_class = mocks['EmailProcessor']
+            self.mock_processor = Mock()
+            self.mock_processor_class.return_value = self.mock_processor
+            
+            self.mock_summarizer_class = mocks['EmailSummarizer']
+            self.mock_summarizer = Mock()
+            self.mock_summarizer_class.return_value = self.mock_summarizer
+            
+            self.mock_writer_class = mocks['YAMLWriter']
+            self.mock_writer = Mock()
+            self.mock_writer_class.return_value = self.mock_writer
+            
+            # Mock argument parsing
+            self.mock_parse_args = mocks['parse_arguments']
+            
+            yield
     
     def test_workflow_with_custom_search_query(self):
         """Test end-to-end workflow with custom search query."""
         # Setup arguments
-        args = Namespace(
-            search_query="from:test@example.com is:unread",
-            search_config=None,
-            max_emails=None,
-            output_dir=None,
-            test_ai=False,
-            list_configs=False,
-            save_config=None,
-            delete_config=None,
-            update_config=None
-        )
+        args = _args(search_query="from:test@example.com is:unread")
         self.mock_parse_args.return_value = args
         
         # Setup email fetching
@@ -278,7 +285,7 @@ class TestWorkflowIntegration(unittest.TestCase):
         result = process_emails()
         
         # Verify success
-        self.assertEqual(result, 0)
+        assert result == 0
         
         # Verify custom query was used
         self.mock_fetcher.fetch_emails_with_query.assert_called_once_with(
@@ -302,17 +309,7 @@ class TestWorkflowIntegration(unittest.TestCase):
         self.search_manager.save_config(test_config)
         
         # Setup arguments
-        args = Namespace(
-            search_query=None,
-            search_config="work-emails",
-            max_emails=None,
-            output_dir=None,
-            test_ai=False,
-            list_configs=False,
-            save_config=None,
-            delete_config=None,
-            update_config=None
-        )
+        args = _args(search_config="work-emails")
         self.mock_parse_args.return_value = args
         
         # Setup email fetching
@@ -339,7 +336,7 @@ class TestWorkflowIntegration(unittest.TestCase):
         result = process_emails()
         
         # Verify success
-        self.assertEqual(result, 0)
+        assert result == 0
         
         # Verify saved config query was used
         self.mock_fetcher.fetch_emails_with_query.assert_called_once_with(
@@ -348,30 +345,20 @@ class TestWorkflowIntegration(unittest.TestCase):
         
         # Verify usage statistics were updated
         updated_config = self.search_manager.load_config("work-emails")
-        self.assertEqual(updated_config.usage_count, 6)  # Incremented from 5
-        self.assertIsNotNone(updated_config.last_used)
+        assert updated_config.usage_count == 6  # Incremented from 5
+        assert updated_config.last_used is not None
     
     def test_workflow_with_invalid_search_config(self):
         """Test workflow error handling with invalid search configuration."""
         # Setup arguments with non-existent config
-        args = Namespace(
-            search_query=None,
-            search_config="nonexistent-config",
-            max_emails=None,
-            output_dir=None,
-            test_ai=False,
-            list_configs=False,
-            save_config=None,
-            delete_config=None,
-            update_config=None
-        )
+        args = _args(search_config="nonexistent-config")
         self.mock_parse_args.return_value = args
         
         # Execute workflow
         result = process_emails()
         
         # Verify error exit code
-        self.assertEqual(result, 1)
+        assert result == 1
         
         # Verify email fetcher was not called
         self.mock_fetcher.fetch_emails_with_query.assert_not_called()
@@ -379,17 +366,7 @@ class TestWorkflowIntegration(unittest.TestCase):
     def test_workflow_with_no_matching_emails(self):
         """Test workflow when search query returns no emails."""
         # Setup arguments
-        args = Namespace(
-            search_query="from:nonexistent@example.com",
-            search_config=None,
-            max_emails=None,
-            output_dir=None,
-            test_ai=False,
-            list_configs=False,
-            save_config=None,
-            delete_config=None,
-            update_config=None
-        )
+        args = _args(search_query="from:nonexistent@example.com")
         self.mock_parse_args.return_value = args
         
         # Setup email fetching to return no emails
@@ -402,7 +379,7 @@ class TestWorkflowIntegration(unittest.TestCase):
         result = process_emails()
         
         # Verify success (empty result is still success)
-        self.assertEqual(result, 0)
+        assert result == 0
         
         # Verify empty file was created
         self.mock_writer.create_empty_summary_file.assert_called_once()
@@ -413,17 +390,7 @@ class TestWorkflowIntegration(unittest.TestCase):
     def test_workflow_error_handling_fetch_failure(self):
         """Test workflow error handling when email fetching fails."""
         # Setup arguments
-        args = Namespace(
-            search_query="from:test@example.com",
-            search_config=None,
-            max_emails=None,
-            output_dir=None,
-            test_ai=False,
-            list_configs=False,
-            save_config=None,
-            delete_config=None,
-            update_config=None
-        )
+        args = _args(search_query="from:test@example.com")
         self.mock_parse_args.return_value = args
         
         # Setup email fetching to fail
@@ -435,7 +402,7 @@ class TestWorkflowIntegration(unittest.TestCase):
         result = process_emails()
         
         # Verify error exit code
-        self.assertEqual(result, 1)
+        assert result == 1
         
         # Verify subsequent steps were not called
         self.mock_summarizer.batch_summarize_emails.assert_not_called()
@@ -444,27 +411,17 @@ class TestWorkflowIntegration(unittest.TestCase):
     def test_workflow_usage_statistics_tracking(self):
         """Test that usage statistics are properly tracked during workflow."""
         # Create multiple test configurations
+        now = datetime.now()
         configs = [
-            SearchConfig("config1", "from:@example1.com", "Config 1", datetime.now(), usage_count=0),
-            SearchConfig("config2", "from:@example2.com", "Config 2", datetime.now(), usage_count=3),
-            SearchConfig("config3", "from:@example3.com", "Config 3", datetime.now(), usage_count=1)
+            SearchConfig("config1", "from:@example1.com", "Config 1", now, usage_count=0),
+            SearchConfig("config2", "from:@example2.com", "Config 2", now, usage_count=3),
+            SearchConfig("config3", "from:@example3.com", "Config 3", now, usage_count=1)
         ]
         
-        for config in configs:
-            self.search_manager.save_config(config)
+        self.search_manager.save_configs(configs)
         
         # Setup arguments to use config2
-        args = Namespace(
-            search_query=None,
-            search_config="config2",
-            max_emails=None,
-            output_dir=None,
-            test_ai=False,
-            list_configs=False,
-            save_config=None,
-            delete_config=None,
-            update_config=None
-        )
+        args = _args(search_config="config2")
         self.mock_parse_args.return_value = args
         
         # Setup successful workflow
@@ -483,35 +440,31 @@ class TestWorkflowIntegration(unittest.TestCase):
         result = process_emails()
         
         # Verify success
-        self.assertEqual(result, 0)
+        assert result == 0
         
         # Verify usage statistics were updated for config2
         updated_config = self.search_manager.load_config("config2")
-        self.assertEqual(updated_config.usage_count, 4)  # Incremented from 3
-        self.assertIsNotNone(updated_config.last_used)
+        assert updated_config.usage_count == 4  # Incremented from 3
+        assert updated_config.last_used is not None
         
         # Verify other configs were not affected
         config1 = self.search_manager.load_config("config1")
         config3 = self.search_manager.load_config("config3")
-        self.assertEqual(config1.usage_count, 0)
-        self.assertEqual(config3.usage_count, 1)
+        assert config1.usage_count == 0
+        assert config3.usage_count == 1
 
 
-class TestSearchConfigurationErrorHandling(unittest.TestCase):
+class TestSearchConfigurationErrorHandling:
     """Test error handling for search configuration scenarios."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup_error_handling(self, fs):
+        """Set up test fixtures on a fresh fake filesystem."""
+        self.temp_dir = FAKE_CONFIG_DIR
+        fs.create_dir(self.temp_dir)
         self.config_file = os.path.join(self.temp_dir, "test_search_configs.json")
         self.search_manager = SearchConfigManager(self.config_file)
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if os.path.exists(self.config_file):
-            os.remove(self.config_file)
-        os.rmdir(self.temp_dir)
-    
     def test_corrupted_config_file_handling(self):
         """Test handling of corrupted configuration file."""
         # Create corrupted JSON file
@@ -521,13 +474,10 @@ class TestSearchConfigurationErrorHandling(unittest.TestCase):
         config = Config()
         config.search_configs_file = self.config_file
         
-        args = Namespace(
-            search_query=None,
-            search_config="any-config"
-        )
+        args = _args(search_config="any-config")
         
         # Should handle the corrupted file gracefully
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             determine_search_query(args, config)
     
     def test_missing_config_file_handling(self):
@@ -539,20 +489,17 @@ class TestSearchConfigurationErrorHandling(unittest.TestCase):
         config = Config()
         config.search_configs_file = self.config_file
         
-        args = Namespace(
-            search_query=None,
-            search_config="any-config"
-        )
+        args = _args(search_config="any-config")
         
         # Should handle missing file by creating it and then reporting config not found
-        with self.assertRaises(ValueError) as context:
+        with pytest.raises(ValueError) as exc_info:
             determine_search_query(args, config)
         
-        self.assertIn("not found", str(context.exception))
+        assert "not found" in str(exc_info.value)
         
         # Verify file was created
-        self.assertTrue(os.path.exists(self.config_file))
+        assert os.path.exists(self.config_file)
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__, "-v"])
\ No newline at end of file
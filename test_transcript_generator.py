@@ -3,44 +3,81 @@ Unit tests for the TranscriptGenerator class.
 
 Tests cover AI prompt generation, fallback transcript creation, YAML loading,
 and error handling scenarios.
+
+The module-level pytest functions use the session fixtures in conftest.py;
+the unittest class builds its own configuration, so it also runs under
+``python -m unittest``. Class-level fixtures are read-only or restored
+after each test, and client mocks are created per test, so the module can
+be run in parallel with pytest-xdist:
+
+    python -m pytest -n auto --dist=loadfile test_transcript_generator.py
 """
 
+import io
+import sys
 import unittest
 import tempfile
-import os
+import pytest
 import yaml
-from unittest.mock import Mock, patch, MagicMock
+from contextlib import contextmanager
+from unittest.mock import Mock, patch, MagicMock, mock_open
 from datetime import datetime
+from types import SimpleNamespace
 
 from summarization.transcript_generator import TranscriptGenerator
-from config.settings import Config
 from utils.error_handling import RetryableError, NonRetryableError, ErrorCategory
 
+try:
+    from yaml import CSafeDumper
+except ImportError:
+    from yaml import SafeDumper as CSafeDumper
+
+
+def _dump_yaml(data, f=None):
+    """Dump test data as YAML using the libyaml dumper when available.
+    
+    Writes to ``f`` if given, otherwise returns the YAML text.
+    """
+    return yaml.dump(data, f, Dumper=CSafeDumper)
+
+
+def _yaml_stream(data):
+    """Return an in-memory YAML stream holding ``data``."""
+    return io.StringIO(_dump_yaml(data))
+
+
+# Transcript date; passed as a datetime so tests skip date string parsing
+DATE = datetime(2025, 9, 19)
+
+def _make_config(**overrides):
+    """Build the test configuration.
+    
+    Config attributes are only read, so a plain namespace is enough.
+    """
+    settings = dict(
+        ai_provider="openai",
+        openai_api_key="test-key",
+        openai_model="gpt-3.5-turbo",
+        claude_model="claude-3-sonnet-20240229",
+        max_tokens=1000,
+        temperature=0.7,
+        transcript_max_tokens=1000,
+        transcript_temperature=0.7
+    )
+    settings.update(overrides)
+    return SimpleNamespace(**settings)
+
 
 class TestTranscriptGenerator(unittest.TestCase):
     """Test cases for TranscriptGenerator class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a mock config with proper string values
-        self.config = Mock(spec=Config)
-        self.config.ai_provider = "openai"
-        self.config.openai_api_key = "test-key"
-        self.config.openai_model = "gpt-3.5-turbo"
-        self.config.claude_model = "claude-3-sonnet-20240229"
-        self.config.max_tokens = 1000
-        self.config.temperature = 0.7
-        self.config.transcript_max_tokens = 1000
-        self.config.transcript_temperature = 0.7
-        
-        # Create mock summarizer
-        self.mock_summarizer = Mock()
-        
-        # Create transcript generator
-        self.generator = TranscriptGenerator(self.config, self.mock_summarizer)
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests; none of them are mutated."""
+        cls.config = _make_config()
         
         # Sample email summaries for testing
-        self.sample_summaries = [
+        cls.sample_summaries = [
             {
                 'subject': 'Friday Newsletter & Home Connection Letter',
                 'sender': 'Madison Yarter <email@renweb.com>',
@@ -74,6 +111,54 @@ class TestTranscriptGenerator(unittest.TestCase):
                 'priority': 'Medium'
             }
         ]
+        
+        # Generator for tests that only call pure formatting helpers
+        cls.shared_generator = TranscriptGenerator(cls.config, None)
+        
+        # YAML document with both sample summaries, dumped once for the class
+        cls.sample_yaml = _dump_yaml({
+            'date': '2025-09-19',
+            'processed_at': '2025-09-19T17:27:49.658114',
+            'email_count': 2,
+            'emails': cls.sample_summaries
+        })
+    
+    def setUp(self):
+        """Set up per-test fixtures."""
+        # Create mock summarizer
+        self.mock_summarizer = Mock()
+        
+        # Create transcript generator
+        self.generator = TranscriptGenerator(self.config, self.mock_summarizer)
+    
+    def _assert_msg(self, context, needle):
+        """Assert that the raised exception's message contains ``needle``."""
+        exception = context.exception
+        self.assertIn(needle, exception.args[0] if exception.args else "")
+    
+    def _swap(self, obj, name, value):
+        """Set an attribute for the rest of the test, restoring it on cleanup.
+        
+        A lighter alternative to patch.object for plain stubs that need no
+        call assertions.
+        """
+        original = getattr(obj, name)
+        setattr(obj, name, value)
+        self.addCleanup(setattr, obj, name, original)
+    
+    @contextmanager
+    def _yaml_fixture(self, data):
+        """Serve YAML as the contents of any file opened inside the block.
+        
+        Args:
+            data: Data to dump as YAML, or a raw YAML string
+            
+        Yields:
+            Path to pass to the generator
+        """
+        read_data = data if isinstance(data, str) else _dump_yaml(data)
+        with patch('builtins.open', mock_open(read_data=read_data)):
+            yield "summaries.yaml"
     
     def test_init_with_summarizer(self):
         """Test initialization with provided summarizer."""
@@ -94,13 +179,13 @@ class TestTranscriptGenerator(unittest.TestCase):
     
     def test_create_transcript_prompt(self):
         """Test AI prompt creation for transcript generation."""
-        date = "2025-09-19"
-        prompt = self.generator._create_transcript_prompt(self.sample_summaries, date)
+        date = DATE
+        prompt = self.shared_generator._create_transcript_prompt(self.sample_summaries, date)
         
         # Verify prompt contains expected elements
         self.assertIn("conversational transcript", prompt)
         self.assertIn("AI host", prompt)
-        self.assertIn(date, prompt)
+        self.assertIn("2025-09-19", prompt)
         self.assertIn("Friday Newsletter", prompt)
         self.assertIn("BTSN Slideshow", prompt)
         self.assertIn("Madison Yarter", prompt)
@@ -110,24 +195,10 @@ class TestTranscriptGenerator(unittest.TestCase):
         self.assertIn("smooth transitions", prompt)
         self.assertIn("professional but friendly tone", prompt)
     
-    def test_format_transcript_content(self):
-        """Test transcript content formatting and cleaning."""
-        raw_content = "**Good morning!** Here's your *email briefing* for today. `Important` stuff here."
-        
-        formatted = self.generator._format_transcript_content(raw_content)
-        
-        # Verify markdown formatting is removed
-        self.assertNotIn("**", formatted)
-        self.assertNotIn("*", formatted)
-        self.assertNotIn("`", formatted)
-        self.assertIn("Good morning!", formatted)
-        self.assertIn("email briefing", formatted)
-        self.assertIn("Important", formatted)
-    
     def test_create_fallback_transcript(self):
         """Test fallback transcript generation."""
-        date = "2025-09-19"
-        transcript = self.generator._create_fallback_transcript(self.sample_summaries, date)
+        date = DATE
+        transcript = self.shared_generator._create_fallback_transcript(self.sample_summaries, date)
         
         # Verify transcript structure
         self.assertIn("Good morning!", transcript)
@@ -142,8 +213,8 @@ class TestTranscriptGenerator(unittest.TestCase):
     
     def test_create_empty_day_transcript(self):
         """Test transcript generation for empty email days."""
-        date = "2025-09-19"
-        transcript = self.generator._create_empty_day_transcript(date)
+        date = DATE
+        transcript = self.shared_generator._create_empty_day_transcript(date)
         
         # Verify empty day transcript content
         self.assertIn("Good morning!", transcript)
@@ -160,33 +231,18 @@ class TestTranscriptGenerator(unittest.TestCase):
     
     def test_load_email_summaries_success(self):
         """Test successful loading of email summaries from YAML file."""
-        # Create temporary YAML file
-        yaml_data = {
-            'date': '2025-09-19',
-            'processed_at': '2025-09-19T17:27:49.658114',
-            'email_count': 2,
-            'emails': self.sample_summaries
-        }
+        summaries = self.generator._load_email_summaries_from_stream(io.StringIO(self.sample_yaml))
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(yaml_data, f)
-            temp_file = f.name
-        
-        try:
-            summaries = self.generator._load_email_summaries(temp_file)
-            
-            self.assertEqual(len(summaries), 2)
-            self.assertEqual(summaries[0]['subject'], 'Friday Newsletter & Home Connection Letter')
-            self.assertEqual(summaries[1]['subject'], 'BTSN Slideshow')
-        finally:
-            os.unlink(temp_file)
+        self.assertEqual(len(summaries), 2)
+        self.assertEqual(summaries[0]['subject'], 'Friday Newsletter & Home Connection Letter')
+        self.assertEqual(summaries[1]['subject'], 'BTSN Slideshow')
     
     def test_load_email_summaries_file_not_found(self):
         """Test loading from non-existent YAML file."""
         with self.assertRaises(NonRetryableError) as context:
             self.generator._load_email_summaries("nonexistent.yaml")
         
-        self.assertIn("YAML file not found", str(context.exception))
+        self._assert_msg(context, "YAML file not found")
         self.assertEqual(context.exception.category, ErrorCategory.VALIDATION)
     
     def test_load_email_summaries_empty_file(self):
@@ -197,37 +253,30 @@ class TestTranscriptGenerator(unittest.TestCase):
             'email_count': 0
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(yaml_data, f)
-            temp_file = f.name
-        
-        try:
-            summaries = self.generator._load_email_summaries(temp_file)
-            self.assertEqual(summaries, [])
-        finally:
-            os.unlink(temp_file)
+        summaries = self.generator._load_email_summaries_from_stream(_yaml_stream(yaml_data))
+        self.assertEqual(summaries, [])
     
     def test_generate_ai_transcript_success(self):
         """Test successful AI transcript generation."""
-        date = "2025-09-19"
+        date = DATE
         mock_ai_response = "Good morning! Here's your email briefing for September 19, 2025. Today I processed 2 important emails for you..."
         
-        # Mock the AI service call method
-        with patch.object(self.generator, '_call_ai_service_for_transcript', return_value=mock_ai_response):
-            transcript = self.generator._generate_ai_transcript(self.sample_summaries, date)
-            
-            self.assertIn("Good morning!", transcript)
-            self.assertIn("September 19, 2025", transcript)
+        # Stub the AI service call method
+        self._swap(self.generator, '_call_ai_service_for_transcript', lambda prompt: mock_ai_response)
+        
+        transcript = self.generator._generate_ai_transcript(self.sample_summaries, date)
+        
+        self.assertIn("Good morning!", transcript)
+        self.assertIn("September 19, 2025", transcript)
     
 
     
     def test_generate_ai_transcript_empty_response(self):
         """Test AI transcript generation with empty AI response."""
-        with patch.object(self.generator, '_call_ai_service_for_transcript', return_value=""):
-            with self.assertRaises(NonRetryableError) as context:
-                self.generator._generate_ai_transcript(self.sample_summaries, "2025-09-19")
-            
-            self.assertIn("empty transcript response", str(context.exception))
+        self._swap(self.generator, '_call_ai_service_for_transcript', lambda prompt: "")
+        
+        with self.assertRaisesRegex(NonRetryableError, "empty transcript response"):
+            self.generator._generate_ai_transcript(self.sample_summaries, DATE)
     
     def test_generate_ai_transcript_no_summarizer(self):
         """Test AI transcript generation when no summarizer is available."""
@@ -235,9 +284,9 @@ class TestTranscriptGenerator(unittest.TestCase):
         generator = TranscriptGenerator(self.config, None)
         
         with self.assertRaises(NonRetryableError) as context:
-            generator._generate_ai_transcript(self.sample_summaries, "2025-09-19")
+            generator._generate_ai_transcript(self.sample_summaries, DATE)
         
-        self.assertIn("AI summarizer not available", str(context.exception))
+        self._assert_msg(context, "AI summarizer not available")
         self.assertEqual(context.exception.category, ErrorCategory.VALIDATION)
     
     def test_generate_ai_transcript_retryable_error(self):
@@ -245,66 +294,54 @@ class TestTranscriptGenerator(unittest.TestCase):
         with patch.object(self.generator, '_call_ai_service_for_transcript') as mock_call:
             mock_call.side_effect = RetryableError("Rate limit exceeded", ErrorCategory.API_RATE_LIMIT)
             
-            with self.assertRaises(RetryableError) as context:
-                self.generator._generate_ai_transcript(self.sample_summaries, "2025-09-19")
-            
-            self.assertIn("Rate limit exceeded", str(context.exception))
+            with self.assertRaisesRegex(RetryableError, "Rate limit exceeded"):
+                self.generator._generate_ai_transcript(self.sample_summaries, DATE)
     
     def test_generate_ai_transcript_nonretryable_error(self):
         """Test AI transcript generation with non-retryable error."""
         with patch.object(self.generator, '_call_ai_service_for_transcript') as mock_call:
             mock_call.side_effect = NonRetryableError("Invalid API key", ErrorCategory.AUTHENTICATION)
             
-            with self.assertRaises(NonRetryableError) as context:
-                self.generator._generate_ai_transcript(self.sample_summaries, "2025-09-19")
-            
-            self.assertIn("Invalid API key", str(context.exception))
+            with self.assertRaisesRegex(NonRetryableError, "Invalid API key"):
+                self.generator._generate_ai_transcript(self.sample_summaries, DATE)
     
     def test_generate_ai_transcript_unexpected_error(self):
         """Test AI transcript generation with unexpected error."""
         with patch.object(self.generator, '_call_ai_service_for_transcript') as mock_call:
             mock_call.side_effect = ValueError("Unexpected error")
             
-            with self.assertRaises(NonRetryableError) as context:
-                self.generator._generate_ai_transcript(self.sample_summaries, "2025-09-19")
-            
-            self.assertIn("Unexpected error in AI transcript generation", str(context.exception))
+            with self.assertRaisesRegex(NonRetryableError, "Unexpected error in AI transcript generation"):
+                self.generator._generate_ai_transcript(self.sample_summaries, DATE)
     
     def test_call_ai_service_for_transcript_openai(self):
         """Test AI service call routing for OpenAI."""
-        self.config.ai_provider = "openai"
+        generator = TranscriptGenerator(_make_config(ai_provider="openai"), self.mock_summarizer)
         
-        with patch.object(self.generator, '_call_openai_for_transcript', return_value="test response") as mock_openai:
-            result = self.generator._call_ai_service_for_transcript("test prompt")
+        with patch.object(generator, '_call_openai_for_transcript', return_value="test response") as mock_openai:
+            result = generator._call_ai_service_for_transcript("test prompt")
             
             mock_openai.assert_called_once_with("test prompt")
             self.assertEqual(result, "test response")
     
     def test_call_ai_service_for_transcript_claude(self):
         """Test AI service call routing for Claude."""
-        self.config.ai_provider = "claude"
+        generator = TranscriptGenerator(_make_config(ai_provider="claude"), self.mock_summarizer)
         
-        with patch.object(self.generator, '_call_claude_for_transcript', return_value="test response") as mock_claude:
-            result = self.generator._call_ai_service_for_transcript("test prompt")
+        with patch.object(generator, '_call_claude_for_transcript', return_value="test response") as mock_claude:
+            result = generator._call_ai_service_for_transcript("test prompt")
             
             mock_claude.assert_called_once_with("test prompt")
             self.assertEqual(result, "test response")
     
     def test_call_ai_service_for_transcript_unsupported_provider(self):
         """Test AI service call with unsupported provider."""
-        self.config.ai_provider = "unsupported"
-        
-        with self.assertRaises(NonRetryableError) as context:
-            self.generator._call_ai_service_for_transcript("test prompt")
+        generator = TranscriptGenerator(_make_config(ai_provider="unsupported"), self.mock_summarizer)
         
-        self.assertIn("Unsupported AI provider", str(context.exception))
+        with self.assertRaisesRegex(NonRetryableError, "Unsupported AI provider"):
+            generator._call_ai_service_for_transcript("test prompt")
     
     def test_call_openai_for_transcript_success(self):
         """Test successful OpenAI API call for transcript."""
-        # Set up config for transcript generation
-        self.config.transcript_max_tokens = 1000
-        self.config.transcript_temperature = 0.7
-        
         # Mock OpenAI client and response
         mock_response = Mock()
         mock_response.choices = [Mock()]
@@ -330,10 +367,8 @@ class TestTranscriptGenerator(unittest.TestCase):
         """Test OpenAI API call when client is not available."""
         self.mock_summarizer.openai_client = None
         
-        with self.assertRaises(NonRetryableError) as context:
+        with self.assertRaisesRegex(NonRetryableError, "OpenAI client not available"):
             self.generator._call_openai_for_transcript("test prompt")
-        
-        self.assertIn("OpenAI client not available", str(context.exception))
     
     def test_call_openai_for_transcript_empty_response(self):
         """Test OpenAI API call with empty response."""
@@ -345,57 +380,11 @@ class TestTranscriptGenerator(unittest.TestCase):
         
         self.mock_summarizer.openai_client = mock_openai_client
         
-        with self.assertRaises(RetryableError) as context:
-            self.generator._call_openai_for_transcript("test prompt")
-        
-        self.assertIn("OpenAI API error", str(context.exception))
-    
-    def test_call_openai_for_transcript_rate_limit_error(self):
-        """Test OpenAI API call with rate limit error."""
-        mock_openai_client = Mock()
-        mock_openai_client.chat.completions.create.side_effect = Exception("rate limit exceeded")
-        
-        self.mock_summarizer.openai_client = mock_openai_client
-        
-        with self.assertRaises(RetryableError) as context:
-            self.generator._call_openai_for_transcript("test prompt")
-        
-        self.assertIn("OpenAI API rate limit exceeded", str(context.exception))
-        self.assertEqual(context.exception.category, ErrorCategory.API_RATE_LIMIT)
-    
-    def test_call_openai_for_transcript_quota_error(self):
-        """Test OpenAI API call with quota error."""
-        mock_openai_client = Mock()
-        mock_openai_client.chat.completions.create.side_effect = Exception("quota exceeded")
-        
-        self.mock_summarizer.openai_client = mock_openai_client
-        
-        with self.assertRaises(NonRetryableError) as context:
-            self.generator._call_openai_for_transcript("test prompt")
-        
-        self.assertIn("OpenAI API quota/billing issue", str(context.exception))
-        self.assertEqual(context.exception.category, ErrorCategory.AUTHENTICATION)
-    
-    def test_call_openai_for_transcript_invalid_key_error(self):
-        """Test OpenAI API call with invalid key error."""
-        mock_openai_client = Mock()
-        mock_openai_client.chat.completions.create.side_effect = Exception("invalid api key")
-        
-        self.mock_summarizer.openai_client = mock_openai_client
-        
-        with self.assertRaises(NonRetryableError) as context:
+        with self.assertRaisesRegex(RetryableError, "OpenAI API error"):
             self.generator._call_openai_for_transcript("test prompt")
-        
-        self.assertIn("OpenAI API key invalid", str(context.exception))
-        self.assertEqual(context.exception.category, ErrorCategory.AUTHENTICATION)
     
     def test_call_claude_for_transcript_success(self):
         """Test successful Claude API call for transcript."""
-        # Set up config for transcript generation
-        self.config.claude_model = "claude-3-sonnet-20240229"
-        self.config.transcript_max_tokens = 1000
-        self.config.transcript_temperature = 0.7
-        
         # Mock Claude client and response
         mock_response = Mock()
         mock_response.content = [Mock()]
@@ -421,10 +410,8 @@ class TestTranscriptGenerator(unittest.TestCase):
         """Test Claude API call when client is not available."""
         self.mock_summarizer.claude_client = None
         
-        with self.assertRaises(NonRetryableError) as context:
+        with self.assertRaisesRegex(NonRetryableError, "Claude client not available"):
             self.generator._call_claude_for_transcript("test prompt")
-        
-        self.assertIn("Claude client not available", str(context.exception))
     
     def test_call_claude_for_transcript_empty_response(self):
         """Test Claude API call with empty response."""
@@ -436,56 +423,22 @@ class TestTranscriptGenerator(unittest.TestCase):
         
         self.mock_summarizer.claude_client = mock_claude_client
         
-        with self.assertRaises(RetryableError) as context:
-            self.generator._call_claude_for_transcript("test prompt")
-        
-        self.assertIn("Claude API error", str(context.exception))
-    
-    def test_call_claude_for_transcript_rate_limit_error(self):
-        """Test Claude API call with rate limit error."""
-        mock_claude_client = Mock()
-        mock_claude_client.messages.create.side_effect = Exception("rate_limit exceeded")
-        
-        self.mock_summarizer.claude_client = mock_claude_client
-        
-        with self.assertRaises(RetryableError) as context:
-            self.generator._call_claude_for_transcript("test prompt")
-        
-        self.assertIn("Claude API rate limit exceeded", str(context.exception))
-        self.assertEqual(context.exception.category, ErrorCategory.API_RATE_LIMIT)
-    
-    def test_call_claude_for_transcript_credit_error(self):
-        """Test Claude API call with credit error."""
-        mock_claude_client = Mock()
-        mock_claude_client.messages.create.side_effect = Exception("insufficient credits")
-        
-        self.mock_summarizer.claude_client = mock_claude_client
-        
-        with self.assertRaises(NonRetryableError) as context:
+        with self.assertRaisesRegex(RetryableError, "Claude API error"):
             self.generator._call_claude_for_transcript("test prompt")
-        
-        self.assertIn("Claude API credit/billing issue", str(context.exception))
-        self.assertEqual(context.exception.category, ErrorCategory.AUTHENTICATION)
     
     def test_load_email_summaries_invalid_yaml(self):
         """Test loading from invalid YAML file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("invalid: yaml: content: [")
-            temp_file = f.name
-        
-        try:
+        with self._yaml_fixture("invalid: yaml: content: [") as yaml_file:
             with self.assertRaises(NonRetryableError) as context:
-                self.generator._load_email_summaries(temp_file)
-            
-            self.assertIn("Failed to parse YAML file", str(context.exception))
-            self.assertEqual(context.exception.category, ErrorCategory.VALIDATION)
-        finally:
-            os.unlink(temp_file)
+                self.generator._load_email_summaries(yaml_file)
+        
+        self._assert_msg(context, "Failed to parse YAML file")
+        self.assertEqual(context.exception.category, ErrorCategory.VALIDATION)
     
     def test_create_fallback_transcript_empty_summaries(self):
         """Test fallback transcript creation with empty summaries."""
-        date = "2025-09-19"
-        transcript = self.generator._create_fallback_transcript([], date)
+        date = DATE
+        transcript = self.shared_generator._create_fallback_transcript([], date)
         
         # Should delegate to empty day transcript
         self.assertIn("no important emails", transcript)
@@ -494,9 +447,9 @@ class TestTranscriptGenerator(unittest.TestCase):
     def test_create_fallback_transcript_single_email(self):
         """Test fallback transcript creation with single email."""
         single_email = [self.sample_summaries[0]]
-        date = "2025-09-19"
+        date = DATE
         
-        transcript = self.generator._create_fallback_transcript(single_email, date)
+        transcript = self.shared_generator._create_fallback_transcript(single_email, date)
         
         self.assertIn("Good morning!", transcript)
         # Check for actual singular form used in implementation
@@ -514,69 +467,26 @@ class TestTranscriptGenerator(unittest.TestCase):
             'action_items': [f'Action item {i}' for i in range(10)]  # 10 action items
         }
         
-        transcript = self.generator._create_fallback_transcript([email_with_many_actions], "2025-09-19")
+        transcript = self.shared_generator._create_fallback_transcript([email_with_many_actions], DATE)
         
         # Should only include first 5 action items
         action_item_count = transcript.count('Action item')
         self.assertEqual(action_item_count, 5)
     
-    def test_format_transcript_content_whitespace_normalization(self):
-        """Test transcript content whitespace normalization."""
-        raw_content = "Good   morning!    Here's    your briefing.   Today   is great."
-        
-        formatted = self.generator._format_transcript_content(raw_content)
-        
-        # Verify excessive whitespace is normalized
-        self.assertNotIn("   ", formatted)
-        self.assertIn("Good morning!", formatted)
-        self.assertIn("Here's your briefing.", formatted)
-    
-    def test_format_transcript_content_sentence_spacing(self):
-        """Test transcript content sentence spacing."""
-        raw_content = "First sentence.Second sentence!Third sentence?Fourth sentence."
-        
-        formatted = self.generator._format_transcript_content(raw_content)
-        
-        # Verify proper spacing after sentence endings
-        self.assertIn("sentence. Second", formatted)
-        self.assertIn("sentence! Third", formatted)
-        self.assertIn("sentence? Fourth", formatted)
-    
     def test_generate_transcript_with_ai_success(self):
         """Test complete transcript generation with AI success."""
-        yaml_data = {
-            'date': '2025-09-19',
-            'processed_at': '2025-09-19T17:27:49.658114',
-            'email_count': 2,
-            'emails': self.sample_summaries
-        }
+        mock_ai_response = "Good morning! Here's your email briefing..."
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(yaml_data, f)
-            temp_file = f.name
+        self._swap(self.generator, '_load_email_summaries', lambda path: self.sample_summaries)
+        self._swap(self.generator, '_call_ai_service_for_transcript', lambda prompt: mock_ai_response)
         
-        mock_ai_response = "Good morning! Here's your email briefing..."
+        transcript = self.generator.generate_transcript("summaries.yaml", DATE)
         
-        with patch.object(self.generator, '_call_ai_service_for_transcript', return_value=mock_ai_response):
-            try:
-                transcript = self.generator.generate_transcript(temp_file, "2025-09-19")
-                
-                self.assertIn("Good morning!", transcript)
-            finally:
-                os.unlink(temp_file)
+        self.assertIn("Good morning!", transcript)
     
     def test_generate_transcript_ai_failure_fallback(self):
         """Test transcript generation with AI failure and fallback."""
-        yaml_data = {
-            'date': '2025-09-19',
-            'processed_at': '2025-09-19T17:27:49.658114',
-            'email_count': 2,
-            'emails': self.sample_summaries
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(yaml_data, f)
-            temp_file = f.name
+        self._swap(self.generator, '_load_email_summaries', lambda path: self.sample_summaries)
         
         # Mock AI service to raise an error
         with patch.object(self.generator, '_call_ai_service_for_transcript') as mock_call:
@@ -584,37 +494,22 @@ class TestTranscriptGenerator(unittest.TestCase):
                 "API rate limit exceeded", ErrorCategory.API_RATE_LIMIT
             )
             
-            try:
-                transcript = self.generator.generate_transcript(temp_file, "2025-09-19")
-                
-                # Should fall back to template-based transcript
-                self.assertIn("Good morning!", transcript)
-                self.assertIn("September 19, 2025", transcript)
-                self.assertIn("2 important emails", transcript)
-            finally:
-                os.unlink(temp_file)
+            transcript = self.generator.generate_transcript("summaries.yaml", DATE)
+            
+            # Should fall back to template-based transcript
+            self.assertIn("Good morning!", transcript)
+            self.assertIn("September 19, 2025", transcript)
+            self.assertIn("2 important emails", transcript)
     
     def test_generate_transcript_empty_summaries(self):
         """Test transcript generation with no email summaries."""
-        yaml_data = {
-            'date': '2025-09-19',
-            'processed_at': '2025-09-19T17:27:49.658114',
-            'email_count': 0,
-            'emails': []
-        }
+        self._swap(self.generator, '_load_email_summaries', lambda path: [])
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(yaml_data, f)
-            temp_file = f.name
+        transcript = self.generator.generate_transcript("summaries.yaml", DATE)
         
-        try:
-            transcript = self.generator.generate_transcript(temp_file, "2025-09-19")
-            
-            # Should generate empty day transcript
-            self.assertIn("no important emails", transcript)
-            self.assertIn("September 19, 2025", transcript)
-        finally:
-            os.unlink(temp_file)
+        # Should generate empty day transcript
+        self.assertIn("no important emails", transcript)
+        self.assertIn("September 19, 2025", transcript)
     
     def test_generate_transcript_file_read_error(self):
         """Test transcript generation with file read error."""
@@ -622,35 +517,19 @@ class TestTranscriptGenerator(unittest.TestCase):
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=True) as f:
             temp_file = f.name
         
-        with self.assertRaises(NonRetryableError) as context:
-            self.generator.generate_transcript(temp_file, "2025-09-19")
-        
-        self.assertIn("YAML file not found", str(context.exception))
+        with self.assertRaisesRegex(NonRetryableError, "YAML file not found"):
+            self.generator.generate_transcript(temp_file, DATE)
     
     def test_generate_transcript_unexpected_error(self):
         """Test transcript generation with unexpected error during processing."""
-        yaml_data = {
-            'date': '2025-09-19',
-            'processed_at': '2025-09-19T17:27:49.658114',
-            'email_count': 1,
-            'emails': self.sample_summaries[:1]
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(yaml_data, f)
-            temp_file = f.name
+        self._swap(self.generator, '_load_email_summaries', lambda path: self.sample_summaries[:1])
         
         # Mock _create_fallback_transcript to raise an unexpected error
         with patch.object(self.generator, '_create_fallback_transcript') as mock_fallback:
             mock_fallback.side_effect = ValueError("Unexpected processing error")
             
-            try:
-                with self.assertRaises(NonRetryableError) as context:
-                    self.generator.generate_transcript(temp_file, "2025-09-19")
-                
-                self.assertIn("Transcript generation failed", str(context.exception))
-            finally:
-                os.unlink(temp_file)
+            with self.assertRaisesRegex(NonRetryableError, "Transcript generation failed"):
+                self.generator.generate_transcript("summaries.yaml", DATE)
     
     def test_create_transcript_prompt_edge_cases(self):
         """Test transcript prompt creation with edge cases."""
@@ -678,7 +557,7 @@ class TestTranscriptGenerator(unittest.TestCase):
         ]
         
         date = "2025-09-19"
-        prompt = self.generator._create_transcript_prompt(incomplete_summaries, date)
+        prompt = self.shared_generator._create_transcript_prompt(incomplete_summaries, date)
         
         # Verify prompt handles missing fields gracefully
         self.assertIn("Complete Email", prompt)
@@ -691,7 +570,7 @@ class TestTranscriptGenerator(unittest.TestCase):
     def test_create_empty_day_transcript_invalid_date(self):
         """Test empty day transcript creation with invalid date format."""
         invalid_date = "invalid-date-format"
-        transcript = self.generator._create_empty_day_transcript(invalid_date)
+        transcript = self.shared_generator._create_empty_day_transcript(invalid_date)
         
         # Should use the raw date string when parsing fails
         self.assertIn(invalid_date, transcript)
@@ -700,7 +579,7 @@ class TestTranscriptGenerator(unittest.TestCase):
     def test_create_fallback_transcript_invalid_date(self):
         """Test fallback transcript creation with invalid date format."""
         invalid_date = "invalid-date-format"
-        transcript = self.generator._create_fallback_transcript(self.sample_summaries, invalid_date)
+        transcript = self.shared_generator._create_fallback_transcript(self.sample_summaries, invalid_date)
         
         # Should use the raw date string when parsing fails
         self.assertIn(invalid_date, transcript)
@@ -714,7 +593,7 @@ class TestTranscriptGenerator(unittest.TestCase):
             'summary': 'Test summary'
         }]
         
-        transcript = self.generator._create_fallback_transcript(email_with_complex_sender, "2025-09-19")
+        transcript = self.shared_generator._create_fallback_transcript(email_with_complex_sender, DATE)
         
         # Should extract just the name part
         self.assertIn("John Doe", transcript)
@@ -724,29 +603,144 @@ class TestTranscriptGenerator(unittest.TestCase):
     
     def test_generate_transcript_no_summarizer_fallback(self):
         """Test transcript generation when no summarizer is available falls back to template."""
-        yaml_data = {
-            'date': '2025-09-19',
-            'processed_at': '2025-09-19T17:27:49.658114',
-            'email_count': 1,
-            'emails': self.sample_summaries[:1]
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(yaml_data, f)
-            temp_file = f.name
+        # The shared generator has no summarizer; the YAML is dumped once per class
+        with self._yaml_fixture(self.sample_yaml) as yaml_file:
+            transcript = self.shared_generator.generate_transcript(yaml_file, "2025-09-19")
         
-        # Create generator without summarizer
-        generator = TranscriptGenerator(self.config, None)
-        
-        try:
-            transcript = generator.generate_transcript(temp_file, "2025-09-19")
-            
-            # Should use template-based transcript
-            self.assertIn("Good morning!", transcript)
-            self.assertIn("Friday Newsletter", transcript)
-        finally:
-            os.unlink(temp_file)
+        # Should use template-based transcript
+        self.assertIn("Good morning!", transcript)
+        self.assertIn("Friday Newsletter", transcript)
+
+
+
+def test_format_transcript_content(transcript_generator):
+    """Test transcript content formatting and cleaning."""
+    raw_content = "**Good morning!** Here's your *email briefing* for today. `Important` stuff here."
+    
+    formatted = transcript_generator._format_transcript_content(raw_content)
+    
+    # Verify markdown formatting is removed
+    assert "**" not in formatted
+    assert "*" not in formatted
+    assert "`" not in formatted
+    assert "Good morning!" in formatted
+    assert "email briefing" in formatted
+    assert "Important" in formatted
+
+
+def test_format_transcript_content_unpaired_markers(transcript_generator):
+    """Test that unpaired markdown markers are kept as content."""
+    raw_content = "* Reminder: bring the `form and *sign it."
+    
+    formatted = transcript_generator._format_transcript_content(raw_content)
+    
+    assert formatted == raw_content
+
+
+def test_format_transcript_content_keeps_arithmetic(transcript_generator):
+    """Test that a lone asterisk between spaces is not treated as italics."""
+    raw_content = "The budget is 5 * 3 * 2 units, as *planned*."
+    
+    formatted = transcript_generator._format_transcript_content(raw_content)
+    
+    assert formatted == "The budget is 5 * 3 * 2 units, as planned."
+
+
+def test_format_transcript_content_whitespace_normalization(transcript_generator):
+    """Test transcript content whitespace normalization."""
+    raw_content = "Good   morning!    Here's    your briefing.   Today   is great."
+    
+    formatted = transcript_generator._format_transcript_content(raw_content)
+    
+    # Verify excessive whitespace is normalized
+    assert "   " not in formatted
+    assert "Good morning!" in formatted
+    assert "Here's your briefing." in formatted
+
+
+def test_format_transcript_content_sentence_spacing(transcript_generator):
+    """Test transcript content sentence spacing."""
+    raw_content = "First sentence.Second sentence!Third sentence?Fourth sentence."
+    
+    formatted = transcript_generator._format_transcript_content(raw_content)
+    
+    # Verify proper spacing after sentence endings
+    assert "sentence. Second" in formatted
+    assert "sentence! Third" in formatted
+    assert "sentence? Fourth" in formatted
+
+
+def test_load_email_summaries_from_file(transcript_generator, tmp_path):
+    """Test loading email summaries from a YAML file on disk."""
+    yaml_file = tmp_path / "summaries.yaml"
+    yaml_file.write_text(_dump_yaml({
+        'date': '2025-09-19',
+        'email_count': 1,
+        'emails': [{'subject': 'On disk', 'sender': 'Disk Sender <disk@example.com>'}]
+    }))
+    
+    summaries = transcript_generator._load_email_summaries(str(yaml_file))
+    
+    assert [summary['subject'] for summary in summaries] == ['On disk']
+
+
+@pytest.fixture
+def mock_summarizer():
+    """Summarizer stub whose AI clients are set per test."""
+    return Mock()
+
+
+@pytest.fixture
+def generator(transcript_config, mock_summarizer):
+    """Transcript generator using the stub summarizer."""
+    return TranscriptGenerator(transcript_config, mock_summarizer)
+
+
+def _failing_openai_client(error):
+    """OpenAI client stub whose completion call raises ``error``."""
+    client = Mock()
+    client.chat.completions.create.side_effect = error
+    return client
+
+
+def _failing_claude_client(error):
+    """Claude client stub whose messages call raises ``error``."""
+    client = Mock()
+    client.messages.create.side_effect = error
+    return client
+
+
+_PROVIDER_CALLS = {
+    "openai": ("openai_client", _failing_openai_client, "_call_openai_for_transcript"),
+    "claude": ("claude_client", _failing_claude_client, "_call_claude_for_transcript"),
+}
+
+
+@pytest.mark.parametrize("provider,api_error,exc_type,message,category", [
+    ("openai", "rate limit exceeded", RetryableError,
+     "OpenAI API rate limit exceeded", ErrorCategory.API_RATE_LIMIT),
+    ("openai", "quota exceeded", NonRetryableError,
+     "OpenAI API quota/billing issue", ErrorCategory.AUTHENTICATION),
+    ("openai", "invalid api key", NonRetryableError,
+     "OpenAI API key invalid", ErrorCategory.AUTHENTICATION),
+    ("claude", "rate_limit exceeded", RetryableError,
+     "Claude API rate limit exceeded", ErrorCategory.API_RATE_LIMIT),
+    ("claude", "insufficient credits", NonRetryableError,
+     "Claude API credit/billing issue", ErrorCategory.AUTHENTICATION),
+])
+def test_provider_error_mapping(provider, api_error, exc_type, message, category,
+                                generator, mock_summarizer):
+    """Test that provider API errors map to the right error type and category."""
+    client_attr, make_client, call_name = _PROVIDER_CALLS[provider]
+    setattr(mock_summarizer, client_attr, make_client(Exception(api_error)))
+    
+    with pytest.raises(exc_type) as exc_info:
+        getattr(generator, call_name)("test prompt")
+    
+    assert message in str(exc_info.value)
+    assert exc_info.value.category == category
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    # Run through pytest so the module-level test functions run too
+    sys.exit(pytest.main([__file__]))